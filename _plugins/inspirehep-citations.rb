@@ -1,13 +1,13 @@
 require "active_support/all"
-require 'net/http'
-require 'json'
-require 'uri'
 
 module Helpers
   extend ActiveSupport::NumberHelper
 end
 
 module Jekyll
+  # Citation counts come from _data/citations.json, written by
+  # scripts/generate_pubs.py alongside papers.bib, so the build makes no
+  # network requests.
   class InspireHEPCitationsTag < Liquid::Tag
     Citations = { }
 
@@ -17,35 +17,22 @@ module Jekyll
     end
 
     def render(context)
-      recid = context[@recid.strip]
-      api_url = "https://inspirehep.net/api/literature/?fields=citation_count&q=recid:#{recid}"
+      recid = context[@recid.strip].to_s
 
-      begin
-        # If the citation count has already been fetched, return it
-        if InspireHEPCitationsTag::Citations[recid]
-          return InspireHEPCitationsTag::Citations[recid]
-        end
-
-        # Fetch the citation count from the API
-        uri = URI(api_url)
-        response = Net::HTTP.get(uri)
-        data = JSON.parse(response)
-
-        # # Log the response for debugging
-        # puts "API Response: #{data.inspect}"
+      # If the citation count has already been formatted, return it
+      if InspireHEPCitationsTag::Citations[recid]
+        return InspireHEPCitationsTag::Citations[recid]
+      end
 
-        # Extract citation count from the JSON data
-        citation_count = data["hits"]["hits"][0]["metadata"]["citation_count"].to_i
+      counts = context.registers[:site].data.dig("citations", "citations") || {}
+      citation_count = counts[recid]
 
-        # Format the citation count for readability
-        citation_count = Helpers.number_to_human(citation_count, format: '%n%u', precision: 2, units: { thousand: 'K', million: 'M', billion: 'B' })
-
-      rescue Exception => e
-        # Handle any errors that may occur during fetching
+      if citation_count.nil?
         citation_count = "N/A"
-
-        # Print the error message including the exception class and message
-        puts "Error fetching citation count for #{recid}: #{e.class} - #{e.message}"
+        puts "No citation count for #{recid} in _data/citations.json"
+      else
+        # Format the citation count for readability
+        citation_count = Helpers.number_to_human(citation_count.to_i, format: '%n%u', precision: 2, units: { thousand: 'K', million: 'M', billion: 'B' })
       end
 
       InspireHEPCitationsTag::Citations[recid] = citation_count
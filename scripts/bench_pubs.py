@@ -0,0 +1,652 @@
+#!/usr/bin/env python3
+"""
+Benchmark the publication formatters on synthetic INSPIRE-HEP data.
+
+Generates a deterministic literature listing of configurable shape (number
+of papers, authors per paper, large collaborations, MathML titles and
+accented names) and times generate_pubs.py's formatters on it, end to end
+and per function, without touching the network.  Also times startup:
+importing generate_pubs in a fresh interpreter, ``--help``, and loading the
+config with and without its parsed-config cache.
+
+Usage:
+    python scripts/bench_pubs.py
+    python scripts/bench_pubs.py --papers 2000 --collab-size 5000 --save bench.json
+    python scripts/bench_pubs.py --compare bench.json
+    python scripts/bench_pubs.py --fixture-dir /tmp/inspire-fixture --no-run
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import unicodedata
+
+import generate_pubs as gp
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CONFIG = os.path.join(SCRIPTS_DIR, "pubs_config.yaml")
+
+# Exit status when --compare finds a regression
+EXIT_REGRESSION = 1
+
+# ---------------------------------------------------------------------------
+# Synthetic INSPIRE records
+# ---------------------------------------------------------------------------
+
+SURNAMES = [
+    "Ivanov",
+    "Chen",
+    "Hill",
+    "Zaldarriaga",
+    "Schmittfull",
+    "Cabass",
+    "Slepian",
+    "Spergel",
+    "Sherwin",
+    "Smith",
+    "Green",
+    "Nishimichi",
+    "Simonović",
+    "Müller",
+    "Kovačević",
+    "Nørgaard",
+    "Łukasz",
+    "Pérez",
+    "Brañas",
+    "Ørsted",
+    "Šťastný",
+    "Gençoğlu",
+    "Dvořák",
+    "Żółkiewski",
+    "Þórsson",
+    "Ðorđević",
+    "Ångström",
+]
+SURNAME_PREFIXES = ["", "", "", "", "de ", "van der ", "Le "]
+GIVEN_NAMES = [
+    "Mikhail M.",
+    "Shi-Fan",
+    "Giovanni",
+    "Zachary",
+    "Matias",
+    "Colin",
+    "J. Colin",
+    "Élodie",
+    "Jürgen",
+    "Łucja",
+    "Søren",
+    "Zoë",
+    "Ana",
+    "Xiao-Dong",
+    "H.E.",
+]
+
+TITLES = [
+    "The {greek}CDM model confronts {obs} data",
+    "Constraints on {obs} from the {survey} galaxy power spectrum",
+    "A {greek}-dependent test of {obs} — with “{survey}” & friends",
+    "Ten percent constraints on {obs} at 3% precision",
+    "Simple title about {obs}",
+]
+MATHML_FRAGMENTS = [
+    '<math display="inline"><msub><mi>f</mi><mrow><mi>NL</mi></mrow></msub></math>',
+    "<math><msub><mi>S</mi><mn>8</mn></msub></math>",
+    "<math><msup><mi>k</mi><mn>2</mn></msup></math>",
+    "<math><msubsup><mi>&#x3c3;</mi><mn>8</mn><mn>2</mn></msubsup></math>",
+    "<math><mfrac><mi>&#x3b1;</mi><mi>&#x3b2;</mi></mfrac></math>",
+    "<math><msub><mi>H</mi><mn>0</mn></msub><mo>=</mo><mn>67</mn></math>",
+    "<math><mi>&#x39b;CDM</mi></math>",
+    "<math><mi>&#x39b;</mi><mtext>CDM</mtext></math>",
+]
+OBSERVABLES = [
+    "the BAO scale",
+    "neutrino masses",
+    "parity violation",
+    "the bispectrum",
+    "H0",
+]
+SURVEYS = ["BOSS", "DESI", "Planck", "Euclid", "Spec-S5"]
+GREEK = ["Λ", "α", "β", "σ", "ω"]
+JOURNALS = [
+    None,
+    {
+        "journal_title": "Phys.Rev.D",
+        "journal_volume": "105",
+        "artid": "043517",
+        "page_start": "043517",
+    },
+    {
+        "journal_title": "Mon.Not.Roy.Astron.Soc.",
+        "journal_volume": "501",
+        "page_start": "123",
+        "page_end": "140",
+    },
+    {"journal_title": "JCAP", "journal_volume": "03", "page_start": "011"},
+    {
+        "journal_title": "Phys.Rev.Lett.",
+        "journal_volume": "131",
+        "artid": "201002",
+        "page_start": "201002",
+    },
+    {"journal_title": "Astrophys.J.", "journal_volume": "951", "page_start": "42"},
+]
+COLLABORATIONS = ["DESI", "Simons Observatory", "Euclid", "Spec-S5"]
+
+
+# Letters without an accent decomposition, for _ascii
+ASCII_LETTERS = str.maketrans(
+    {"Ø": "O", "ø": "o", "Ł": "L", "ł": "l", "Þ": "Th", "Ð": "D", "đ": "d"}
+)
+
+
+def _ascii(text):
+    """'Kovačević' -> 'Kovacevic'."""
+    decomposed = unicodedata.normalize("NFKD", text.translate(ASCII_LETTERS))
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def _full_name(rng, unicode_fraction):
+    surname = rng.choice(SURNAMES)
+    given = rng.choice(GIVEN_NAMES)
+    if rng.random() >= unicode_fraction:
+        surname, given = _ascii(surname), _ascii(given)
+    return f"{rng.choice(SURNAME_PREFIXES)}{surname}, {given}"
+
+
+def _title(rng, mathml_fraction):
+    title = rng.choice(TITLES).format(
+        greek=rng.choice(GREEK), obs=rng.choice(OBSERVABLES), survey=rng.choice(SURVEYS)
+    )
+    if rng.random() < mathml_fraction:
+        fragments = rng.sample(MATHML_FRAGMENTS, rng.randint(1, 3))
+        title = " and ".join([title] + fragments)
+    return title
+
+
+def make_hit(rng, i, n_authors, texkey, mathml_fraction=0.3, unicode_fraction=0.3):
+    """One INSPIRE literature hit, restricted to ``Paper.FIELDS``."""
+    authors = [
+        {"full_name": _full_name(rng, unicode_fraction)} for _ in range(n_authors)
+    ]
+    if rng.random() < 0.4:
+        authors.sort(key=lambda a: a["full_name"].lower())
+    authors.insert(rng.randrange(n_authors + 1), {"full_name": "Philcox, Oliver H.E."})
+    year = 2015 + i % 11
+    title = _title(rng, mathml_fraction)
+    md = {
+        "control_number": 1000000 + i,
+        "texkeys": [texkey],
+        "titles": [{"title": title}],
+        "authors": authors,
+        "arxiv_eprints": [
+            {
+                "value": f"{year % 100:02d}{1 + i % 12:02d}.{i:05d}",
+                "categories": ["astro-ph.CO"],
+            }
+        ],
+        "document_type": ["article"],
+        "preprint_date": f"{year}-{1 + i % 12:02d}-15",
+    }
+    if rng.random() < 0.5:
+        md["titles"].append({"title": title.upper(), "source": "arXiv"})
+    journal = rng.choice(JOURNALS)
+    if journal:
+        md["publication_info"] = [dict(journal, year=year + 1)]
+        md["dois"] = [{"value": f"10.1103/bench.{i}"}]
+    if n_authors >= 100:
+        md["collaborations"] = [{"value": rng.choice(COLLABORATIONS)}]
+    return {
+        "id": str(md["control_number"]),
+        "metadata": md,
+        "updated": f"{year + 1}-06-01T00:00:00.000000+00:00",
+    }
+
+
+def make_listing(
+    config,
+    papers=500,
+    authors=(1, 12),
+    collab_fraction=0.05,
+    collab_size=5000,
+    mathml_fraction=0.3,
+    unicode_fraction=0.3,
+    seed=0,
+):
+    """A deterministic list of synthetic hits.  Texkeys from the config are
+    reused first so classification and overrides are exercised."""
+    rng = random.Random(seed)
+    known = sorted(config.referenced_texkeys())
+    hits = []
+    for i in range(papers):
+        texkey = known[i] if i < len(known) else f"Bench:{2015 + i % 11}{i:05d}"
+        if rng.random() < collab_fraction:
+            n_authors = collab_size
+        else:
+            n_authors = rng.randint(*authors)
+        hits.append(
+            make_hit(rng, i, n_authors, texkey, mathml_fraction, unicode_fraction)
+        )
+    return hits
+
+
+def bibtex_blob(hit):
+    """An INSPIRE-style BibTeX record for ``hit``, as served by format=bibtex."""
+    md = hit["metadata"]
+    authors = md["authors"]
+    names = " and ".join(a["full_name"] for a in authors[:10])
+    if len(authors) > 10:
+        names = authors[0]["full_name"] + " and others"
+    lines = [
+        f"@article{{{md['texkeys'][0]},",
+        f'    author = "{names}",',
+        f'    title = "{{{md["titles"][0]["title"]}}}",',
+        f'    eprint = "{md["arxiv_eprints"][0]["value"]}",',
+        '    archivePrefix = "arXiv",',
+        '    primaryClass = "astro-ph.CO",',
+    ]
+    if md.get("dois"):
+        lines.append(f'    doi = "{md["dois"][0]["value"]}",')
+    lines.append(f'    year = "{md["preprint_date"][:4]}"')
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def write_fixture(hits, fixture_dir):
+    """Write ``literature.json`` (one INSPIRE search page holding every hit)
+    and the matching ``literature.bib``."""
+    os.makedirs(fixture_dir, exist_ok=True)
+    page = {"hits": {"hits": hits, "total": len(hits)}, "links": {}}
+    with open(os.path.join(fixture_dir, "literature.json"), "w") as f:
+        json.dump(page, f)
+    with open(os.path.join(fixture_dir, "literature.bib"), "w") as f:
+        f.write("\n".join(bibtex_blob(hit) for hit in hits))
+    print(f"Wrote {len(hits)} records to {fixture_dir}")
+
+
+# ---------------------------------------------------------------------------
+# Timing
+# ---------------------------------------------------------------------------
+
+
+def _best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        gp._format_author_name.cache_clear()
+        gp._convert_math.cache_clear()
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _peak_memory(fn):
+    gp._format_author_name.cache_clear()
+    gp._convert_math.cache_clear()
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmarks(hits, config, repeat=5):
+    """Time each benchmark, returning ``{name: result}``.
+
+    Per-function benchmarks run over every paper (or name / title) in the
+    listing.  The author-name and MathML caches are cleared before each
+    repeat, so memoisation only helps within a run, as in production.
+    """
+    page = json.dumps(
+        {"hits": {"hits": hits, "total": len(hits)}, "links": {}}
+    ).encode()
+    papers = [gp.Paper.from_metadata(hit["metadata"]) for hit in hits]
+    rendered = [(p, gp.classify_paper(p.texkey, config)) for p in papers]
+    rendered = [(p, cat) for p, cat in rendered if cat != "exclude"]
+    names = [name for p in papers for name in p.authors]
+    titles = [p.title for p in papers]
+    overrides = config.author_name_overrides
+    highlight = config.highlight_surname()
+
+    benchmarks = [
+        # name, items, callable, measure peak memory
+        (
+            "decode_page",
+            len(hits),
+            lambda: list(gp._iter_search_page(io.BytesIO(page))),
+            True,
+        ),
+        (
+            "paper_from_metadata",
+            len(hits),
+            lambda: [gp.Paper.from_metadata(h["metadata"]) for h in hits],
+            False,
+        ),
+        (
+            "generate_pubstex",
+            len(papers),
+            lambda: gp.generate_pubstex(papers, config),
+            True,
+        ),
+        (
+            "generate_bibtex",
+            len(papers),
+            lambda: gp.generate_bibtex(papers, config),
+            True,
+        ),
+        (
+            "generate_outputs",
+            len(papers),
+            lambda: gp.generate_outputs(papers, config),
+            True,
+        ),
+        (
+            "format_item",
+            len(rendered),
+            lambda: [
+                gp.format_item(p, config, is_contributing=(cat == "contributing"))
+                for p, cat in rendered
+            ],
+            False,
+        ),
+        (
+            "format_bibtex_entry",
+            len(rendered),
+            lambda: [gp.format_bibtex_entry(p, config) for p, _ in rendered],
+            False,
+        ),
+        (
+            "get_title",
+            len(papers),
+            lambda: [gp.get_title(p, config) for p in papers],
+            False,
+        ),
+        (
+            "normalize_title",
+            len(titles),
+            lambda: [gp.normalize_title(t) for t in titles if t],
+            False,
+        ),
+        (
+            "title_to_latex",
+            len(titles),
+            lambda: [gp.title_to_latex(t) for t in titles if t],
+            False,
+        ),
+        (
+            "scan_authors",
+            len(papers),
+            lambda: [gp.scan_authors(p.authors, highlight) for p in papers],
+            False,
+        ),
+        (
+            "format_author_name",
+            len(names),
+            lambda: [gp.format_author_name(n, overrides, highlight) for n in names],
+            False,
+        ),
+        (
+            "bibtex_escape",
+            len(names),
+            lambda: [gp.bibtex_escape(n) for n in names],
+            False,
+        ),
+    ]
+
+    results = {}
+    for name, items, fn, memory in benchmarks:
+        seconds = _best_of(fn, repeat)
+        result = {
+            "items": items,
+            "seconds": round(seconds, 6),
+            "items_per_s": round(items / seconds, 1) if seconds else None,
+        }
+        if memory:
+            result["peak_kib"] = round(_peak_memory(fn) / 1024, 1)
+        results[name] = result
+        print(_format_row(name, result))
+    return results
+
+
+def _best_of_process(argv, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        subprocess.run(
+            argv, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def run_startup_benchmarks(config_path, repeat=5):
+    """Time startup, returning ``{name: result}`` like ``run_benchmarks``.
+
+    Process timings include interpreter start-up (``startup_python`` alone,
+    for reference).  The config is loaded from a copy whose mtime is in the
+    past, so the parsed-config cache is trusted without re-hashing.
+    """
+    python = sys.executable
+    import_gp = f"import sys; sys.path.insert(0, {SCRIPTS_DIR!r}); import generate_pubs"
+    timings = {
+        "startup_python": _best_of_process([python, "-c", "pass"], repeat),
+        "startup_import": _best_of_process([python, "-c", import_gp], repeat),
+        "startup_help": _best_of_process(
+            [python, os.path.join(SCRIPTS_DIR, "generate_pubs.py"), "--help"], repeat
+        ),
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, os.path.basename(config_path))
+        shutil.copyfile(config_path, path)
+        past = time.time() - 60
+        os.utime(path, (past, past))
+        cache_path = gp._config_cache_path(path)
+
+        def _cold():
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+            gp.load_config(path)
+
+        timings["load_config_cold"] = _best_of(_cold, repeat)
+        gp.load_config(path)
+        timings["load_config_cached"] = _best_of(lambda: gp.load_config(path), repeat)
+
+    results = {}
+    for name, seconds in timings.items():
+        result = {
+            "items": 1,
+            "seconds": round(seconds, 6),
+            "items_per_s": round(1 / seconds, 1),
+        }
+        results[name] = result
+        print(_format_row(name, result))
+    check = subprocess.run(
+        [
+            python,
+            "-c",
+            import_gp + "; print(sorted({'requests', 'yaml'} & set(sys.modules)))",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    print(f"  imported by generate_pubs at startup: {check.stdout.strip()}")
+    return results
+
+
+def _format_row(name, result):
+    peak = f"{result['peak_kib']:10.0f} KiB" if "peak_kib" in result else ""
+    return (
+        f"  {name:<22s} {result['seconds'] * 1000:9.2f} ms "
+        f"{result['items_per_s'] or 0:12.0f} /s {result['items']:>8d} items{peak}"
+    )
+
+
+def compare(results, baseline, tolerance):
+    """Print the ratio of each timing to ``baseline`` and return the names of
+    benchmarks that are more than ``tolerance`` times slower."""
+    regressions = []
+    print(f"Compared with baseline ({baseline['meta']['timestamp']}):")
+    for name, result in results.items():
+        base = baseline["results"].get(name)
+        if not base or not base["seconds"]:
+            continue
+        ratio = result["seconds"] / base["seconds"]
+        flag = "  REGRESSION" if ratio > tolerance else ""
+        print(f"  {name:<22s} {ratio:6.2f}x{flag}")
+        if ratio > tolerance:
+            regressions.append(name)
+    return regressions
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def _range(text):
+    lo, _, hi = text.partition("-")
+    return int(lo), int(hi or lo)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the publication formatters")
+    parser.add_argument(
+        "--config",
+        default=DEFAULT_CONFIG,
+        help="YAML config (default: pubs_config.yaml)",
+    )
+    parser.add_argument(
+        "--papers", type=int, default=500, help="Number of papers (default: 500)"
+    )
+    parser.add_argument(
+        "--authors",
+        type=_range,
+        default=(1, 12),
+        metavar="MIN-MAX",
+        help="Authors per ordinary paper (default: 1-12)",
+    )
+    parser.add_argument(
+        "--collab-fraction",
+        type=float,
+        default=0.05,
+        help="Fraction of papers from large collaborations (default: 0.05)",
+    )
+    parser.add_argument(
+        "--collab-size",
+        type=int,
+        default=5000,
+        help="Authors per collaboration paper (default: 5000)",
+    )
+    parser.add_argument(
+        "--mathml-fraction",
+        type=float,
+        default=0.3,
+        help="Fraction of titles containing MathML (default: 0.3)",
+    )
+    parser.add_argument(
+        "--unicode-fraction",
+        type=float,
+        default=0.3,
+        help="Fraction of names keeping their accented characters (default: 0.3)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Timing repeats; the best is kept (default: 5)",
+    )
+    parser.add_argument(
+        "--fixture-dir", help="Also write the listing as literature.json/.bib here"
+    )
+    parser.add_argument("--no-run", action="store_true", help="Only write the fixture")
+    parser.add_argument("--save", metavar="PATH", help="Write results as JSON to PATH")
+    parser.add_argument(
+        "--compare", metavar="PATH", help="Compare with results saved by --save"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1.25,
+        help=(
+            "Slowdown ratio counted as a regression by --compare; "
+            f"exits {EXIT_REGRESSION} (default: 1.25)"
+        ),
+    )
+    args = parser.parse_args()
+
+    config = gp.load_config(args.config)
+    shape = {
+        "papers": args.papers,
+        "authors": list(args.authors),
+        "collab_fraction": args.collab_fraction,
+        "collab_size": args.collab_size,
+        "mathml_fraction": args.mathml_fraction,
+        "unicode_fraction": args.unicode_fraction,
+        "seed": args.seed,
+    }
+    hits = make_listing(
+        config,
+        papers=args.papers,
+        authors=args.authors,
+        collab_fraction=args.collab_fraction,
+        collab_size=args.collab_size,
+        mathml_fraction=args.mathml_fraction,
+        unicode_fraction=args.unicode_fraction,
+        seed=args.seed,
+    )
+    if args.fixture_dir:
+        write_fixture(hits, args.fixture_dir)
+    if args.no_run:
+        return 0
+
+    n_authors = sum(len(hit["metadata"]["authors"]) for hit in hits)
+    print(
+        f"Benchmarking {len(hits)} papers, {n_authors} authors (best of {args.repeat}):"
+    )
+    results = run_benchmarks(hits, config, repeat=args.repeat)
+    print(f"Startup (best of {args.repeat}):")
+    results.update(run_startup_benchmarks(args.config, repeat=args.repeat))
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "ijson": gp.ijson is not None,
+            "shape": shape,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print(f"Results written to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline["meta"].get("shape") != shape:
+            print(
+                "  Warning: baseline was run with a different fixture shape",
+                file=sys.stderr,
+            )
+        if compare(results, baseline, args.tolerance):
+            return EXIT_REGRESSION
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,23 +7,49 @@ Usage:
     python3 generate_pubs.py --config pubs_config.yaml --bibtex-only
     python3 generate_pubs.py --config pubs_config.yaml --pubstex-only
     python3 generate_pubs.py --config pubs_config.yaml --dry-run
+    python3 generate_pubs.py --config pubs_config.yaml --page-size 50 --max-records 500
+    python3 generate_pubs.py --config pubs_config.yaml --offline
+    python3 generate_pubs.py --config pubs_config.yaml --full-sync
+    python3 generate_pubs.py --config pubs_config.yaml --exit-code  # 3 if changed
+    python3 generate_pubs.py --group group.yaml  # every member of a research group
+    python3 generate_pubs.py --config pubs_config.yaml --watch  # regenerate on changes
 """
 
 import argparse
+import contextlib
+import dataclasses
+import functools
+import hashlib
+import html
+import json
+import math
 import os
+import random
 import re
+import shutil
+import sqlite3
 import sys
+import tempfile
+import threading
 import time
+import traceback
+import types
+import unicodedata
 
-import requests
-import yaml
+# requests, PyYAML and a few slow stdlib modules are imported where they are
+# first needed (see _requests and _yaml_load): runs served from the response
+# cache or record store never touch the network, and unchanged configs load
+# from a parsed-config cache, so short runs skip most of the import cost.
+
+try:
+    import ijson
+except ImportError:  # optional: fall back to decoding whole pages
+    ijson = None
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
-PHILCOX_BOLD = r"\textbf{Philcox, O.\,H.\,E.}"
-
 # Unicode -> LaTeX for author names
 UNICODE_TO_LATEX = {
     "\u00e4": '\\"a',  # ä
@@ -52,6 +78,203 @@ UNICODE_TO_LATEX = {
     "\u00e6": "{\\ae}",  # æ
 }
 
+# LaTeX accent commands for Unicode combining marks.  Letter-named accents
+# take a braced argument (\v{c}); symbol accents are prefixed (\'e).
+COMBINING_ACCENTS = {
+    "\u0300": "`",  # grave
+    "\u0301": "'",  # acute
+    "\u0302": "^",  # circumflex
+    "\u0303": "~",  # tilde
+    "\u0304": "=",  # macron
+    "\u0306": "u",  # breve
+    "\u0307": ".",  # dot above
+    "\u0308": '"',  # diaeresis
+    "\u030a": "r",  # ring above
+    "\u030b": "H",  # double acute
+    "\u030c": "v",  # caron
+    "\u0323": "d",  # dot below
+    "\u0327": "c",  # cedilla
+    "\u0328": "k",  # ogonek
+}
+
+# Latin letters with no accent decomposition
+UNICODE_SPECIALS = {
+    "\u00c5": "{\\AA}",  # Å
+    "\u00e5": "{\\aa}",  # å
+    "\u00c6": "{\\AE}",  # Æ
+    "\u00d8": "{\\O}",  # Ø
+    "\u00df": "{\\ss}",  # ß
+    "\u00d0": "{\\DH}",  # Ð
+    "\u00f0": "{\\dh}",  # ð
+    "\u00de": "{\\TH}",  # Þ
+    "\u00fe": "{\\th}",  # þ
+    "\u0110": "{\\DJ}",  # Đ
+    "\u0111": "{\\dj}",  # đ
+    "\u0131": "{\\i}",  # ı
+    "\u0141": "{\\L}",  # Ł
+    "\u0152": "{\\OE}",  # Œ
+    "\u0153": "{\\oe}",  # œ
+}
+
+
+def _accented_latin_to_latex():
+    """LaTeX for every Latin-1 Supplement / Latin Extended-A/B letter that
+    decomposes into a base letter plus one accent (e.g. 'ę' -> '\\k{e}')."""
+    table = {}
+    for cp in range(0x00C0, 0x0250):
+        char = chr(cp)
+        decomp = unicodedata.normalize("NFD", char)
+        if len(decomp) != 2 or decomp[1] not in COMBINING_ACCENTS:
+            continue
+        base, accent = decomp[0], COMBINING_ACCENTS[decomp[1]]
+        if not base.isascii() or not base.isalpha():
+            continue
+        if base in "ij" and accent not in "cdk":
+            base = "\\" + base  # dotless i/j under accents above the letter
+        if accent.isalpha():
+            table[char] = f"\\{accent}{{{base}}}"
+        else:
+            table[char] = f"\\{accent}{base}"
+    return table
+
+
+# Full author-name table: generated accents, then specials, with the
+# hand-written entries above taking precedence
+UNICODE_TO_LATEX = {
+    **_accented_latin_to_latex(),
+    **UNICODE_SPECIALS,
+    **UNICODE_TO_LATEX,
+}
+
+# Single-pass translation tables for author names (plain and BibTeX-braced)
+_UNICODE_TRANS = str.maketrans(UNICODE_TO_LATEX)
+_BIBTEX_TRANS = str.maketrans(
+    {
+        char: latex if latex.startswith("{") else "{" + latex + "}"
+        for char, latex in UNICODE_TO_LATEX.items()
+    }
+)
+
+# Greek letters in titles -> LaTeX math commands
+GREEK_TO_LATEX = {
+    "\u03b5": "\\epsilon",  # ε
+    "\u03c2": "\\varsigma",  # ς
+    "\u03d1": "\\vartheta",  # ϑ
+    "\u03d5": "\\phi",  # ϕ
+    "\u03d6": "\\varpi",  # ϖ
+    "\u03f1": "\\varrho",  # ϱ
+    "\u03f5": "\\epsilon",  # ϵ
+    "\u00b5": "\\mu",  # µ (micro sign)
+}
+for _cp in range(0x0391, 0x03CA):
+    # e.g. "GREEK SMALL LETTER ALPHA"; skips tonos/dialytika variants
+    _words = unicodedata.name(chr(_cp), "").split()
+    if len(_words) != 4:
+        continue
+    _letter = _words[3].replace("LAMDA", "LAMBDA").capitalize()
+    if _words[1] == "SMALL" and _letter != "Omicron":
+        GREEK_TO_LATEX.setdefault(chr(_cp), "\\" + _letter.lower())
+    elif _letter in (
+        "Gamma",
+        "Delta",
+        "Theta",
+        "Lambda",
+        "Xi",
+        "Pi",
+        "Sigma",
+        "Upsilon",
+        "Phi",
+        "Psi",
+        "Omega",
+    ):
+        GREEK_TO_LATEX[chr(_cp)] = "\\" + _letter
+del _cp, _words, _letter
+
+# MathML <mo> operators -> LaTeX (anything else is kept as is)
+MATHML_OPERATORS = {
+    "\u2212": "-",  # minus sign
+    "\u2013": "-",  # en-dash used as minus
+    "\u00d7": "\\times",
+    "\u00b7": "\\cdot",
+    "\u22c5": "\\cdot",
+    "\u00b1": "\\pm",
+    "\u2213": "\\mp",
+    "\u2264": "\\leq",
+    "\u2265": "\\geq",
+    "\u226a": "\\ll",
+    "\u226b": "\\gg",
+    "\u2260": "\\neq",
+    "\u223c": "\\sim",
+    "\u2243": "\\simeq",
+    "\u2248": "\\approx",
+    "\u221d": "\\propto",
+    "\u2192": "\\to",
+    "\u221e": "\\infty",
+    "\u2202": "\\partial",
+    "\u2207": "\\nabla",
+    "\u2211": "\\sum",
+    "\u222b": "\\int",
+    "\u27e8": "\\langle",
+    "\u27e9": "\\rangle",
+    "\u2272": "\\lesssim",
+    "\u2273": "\\gtrsim",
+    "\u2032": "'",
+    "\u2217": "*",
+    "\u2061": "",  # invisible function application
+    "\u2062": "",  # invisible times
+    # Converted fragments are not passed through normalize_title, so they
+    # escape LaTeX's special characters themselves
+    "%": "\\%",
+    "&": "\\&",
+    "#": "\\#",
+}
+
+# <mover> accents -> LaTeX accent commands
+MATHML_ACCENTS = {
+    "~": "\\tilde",
+    "\u02dc": "\\tilde",
+    "^": "\\hat",
+    "\u02c6": "\\hat",
+    "\u00af": "\\bar",
+    "\u203e": "\\bar",
+    "\u02d9": "\\dot",
+    "\u00a8": "\\ddot",
+    "\u2192": "\\vec",
+}
+
+# Multi-letter <mi> identifiers that are LaTeX operator names; any other
+# multi-letter identifier (e.g. the NL of f_NL) is set upright with \rm
+MATHML_FUNCTIONS = frozenset(
+    [
+        "sin",
+        "cos",
+        "tan",
+        "exp",
+        "log",
+        "ln",
+        "max",
+        "min",
+        "lim",
+        "det",
+        "arcsin",
+        "arccos",
+        "arctan",
+    ]
+)
+
+# Distinct <math> fragments kept by the MathML conversion cache
+MATHML_CACHE_SIZE = 1024
+
+# Punctuation in titles -> LaTeX
+TITLE_PUNCTUATION = {
+    "\u2013": "--",  # en-dash
+    "\u2014": "---",  # em-dash
+    "\u2019": "'",  # right single quote
+    "\u2018": "`",  # left single quote
+    "\u201c": "``",  # left double quote
+    "\u201d": "''",  # right double quote
+}
+
 # Journals where page ranges should use $start-end$ (math-mode dash)
 PAGE_RANGE_JOURNALS = {
     "Mon.Not.Roy.Astron.Soc.",
@@ -70,54 +293,893 @@ ISSUE_AS_PAGES_JOURNALS = {
 # Maximum number of authors before truncating; papers with >this get first N + et al.
 CONTRIB_AUTHOR_TRUNCATE = 6
 
+# publication_info keys kept on each Paper
+PUB_INFO_KEYS = (
+    "journal_title",
+    "journal_volume",
+    "journal_issue",
+    "page_start",
+    "page_end",
+    "artid",
+    "year",
+)
+
+INSPIRE_API_URL = "https://inspirehep.net/api/literature"
+
+# Records per INSPIRE page; larger pages are slower and more timeout-prone
+DEFAULT_PAGE_SIZE = 100
+
+# Response cache location (relative to the config file) and the age in seconds
+# after which responses without ETag/Last-Modified validators are re-fetched
+DEFAULT_CACHE_DIR = ".inspire_cache"
+DEFAULT_CACHE_TTL = 6 * 3600
+
+# Local record store used for delta syncs (relative to the config file)
+DEFAULT_RECORD_STORE = ".inspire_records.sqlite"
+
+# Cached per-paper renderings (relative to the config file)
+DEFAULT_RENDER_MANIFEST = ".render_manifest.json"
+
+# Control numbers per "recid:a or recid:b ..." query, to keep URLs short
+RECID_BATCH_SIZE = 50
+
+# Fields requested when only citation counts are needed
+CITATION_FIELDS = ("control_number", "citation_count")
+
+# INSPIRE document_type -> BibTeX entry type (anything else is @article)
+BIBTEX_ENTRY_TYPES = {
+    "thesis": "phdthesis",
+    "conference paper": "inproceedings",
+    "book chapter": "incollection",
+    "book": "book",
+    "proceedings": "proceedings",
+}
+
+# Author lists longer than this become "First Author and others" in BibTeX
+BIBTEX_MAX_AUTHORS = 10
+
+# Keys and status values allowed in a per-paper ``overrides`` entry
+OVERRIDE_KEYS = {
+    "status",
+    "journal",
+    "volume",
+    "pages",
+    "year",
+    "doi",
+    "arxiv_id",
+    "verbatim_ref",
+}
+# Override keys that YAML may give as bare integers ("year: 2024")
+OVERRIDE_NUMERIC_KEYS = {"volume", "pages", "year"}
+OVERRIDE_STATUSES = {
+    "submitted",
+    "accepted",
+    "published",
+    "book_chapter",
+    "white_paper",
+}
+
+# Exit status for --exit-code when an output file changed
+EXIT_CHANGED = 3
+
+# HTTP keep-alive pool size and per-request timeout (seconds)
+DEFAULT_POOL_SIZE = 4
+DEFAULT_HTTP_TIMEOUT = 60
+
+# Concurrent INSPIRE requests in --group mode
+DEFAULT_GROUP_WORKERS = 4
+
+# Website outputs a --group member writes only if its config names them; the
+# Config defaults are this site's own _bibliography/ and _data/ files
+GROUP_MEMBER_OUTPUTS = ("output_bibtex", "output_citations", "output_publications")
+
+# Retry policy shared by every INSPIRE request: attempts per request, the
+# backoff base and cap (seconds), and the total seconds a run may spend
+# waiting between retries
+DEFAULT_RETRY_ATTEMPTS = 4
+RETRY_BASE_DELAY = 2.0
+RETRY_MAX_DELAY = 60.0
+DEFAULT_RETRY_BUDGET = 300
+
+# HTTP statuses worth retrying; any other error status fails immediately
+RETRYABLE_STATUSES = frozenset([408, 425, 429, 500, 502, 503, 504])
+
+# --watch: seconds between checks for INSPIRE or config changes, and the
+# longest wait when backing off after failed checks
+DEFAULT_WATCH_INTERVAL = 600
+DEFAULT_WATCH_MAX_INTERVAL = 3600
+
+# Bytes read per chunk when spooling a response body, and the size above
+# which an uncached body is spooled to a temporary file instead of memory
+STREAM_CHUNK_SIZE = 64 * 1024
+SPOOL_MEMORY_SIZE = 8 * 1024 * 1024
+
+# Format of the parsed-config cache written next to each config file, and
+# how much older than the cache a config's mtime must be to be trusted
+CONFIG_CACHE_VERSION = 1
+CONFIG_MTIME_SLACK_NS = 2_000_000_000
+
+# Distinct (name, override) pairs kept by the author-name formatting cache
+AUTHOR_NAME_CACHE_SIZE = 4096
+
+# Lowercase surname particles that INSPIRE sometimes leaves among the given
+# names, alone ("Berg, Anna van der") or before more of the surname
+# ("Ribeiro, Jose da Silva")
+NAME_PARTICLES = frozenset(
+    [
+        "da",
+        "das",
+        "de",
+        "del",
+        "della",
+        "der",
+        "di",
+        "do",
+        "dos",
+        "du",
+        "la",
+        "le",
+        "ten",
+        "ter",
+        "van",
+        "von",
+        "y",
+    ]
+)
+
+# Generational suffixes, given as a trailing comma field ("Smith, John, Jr.")
+# or after the given names ("Smith, John Jr.")
+NAME_SUFFIXES = frozenset(["Jr.", "Jr", "Sr.", "Sr", "II", "III", "IV"])
+
 
 # ---------------------------------------------------------------------------
-# Data fetching
+# Instrumentation
 # ---------------------------------------------------------------------------
 
 
-def fetch_papers_json(query, size=250):
-    """Fetch papers from INSPIRE JSON API with retries."""
-    url = "https://inspirehep.net/api/literature"
-    params = {
-        "q": f"a {query}",
-        "size": size,
-        "sort": "mostrecent",
-    }
-    for attempt in range(3):
+class RunStats:
+    """Accumulated wall time and call counts per stage, plus named counters.
+
+    Stages that interleave (fetching and formatting stream together) are
+    timed around each individual call, so their totals do not overlap.
+    Updates are locked, as --group fetches on several threads.
+    """
+
+    def __init__(self):
+        self.seconds = {}
+        self.calls = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    def add(self, stage, seconds, calls=1):
+        with self._lock:
+            self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+            self.calls[stage] = self.calls.get(stage, 0) + calls
+
+    def count(self, name, n=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    @contextlib.contextmanager
+    def timer(self, stage):
+        t0 = time.perf_counter()
         try:
-            resp = requests.get(url, params=params, timeout=60)
-            resp.raise_for_status()
-            data = resp.json()
-            return data["hits"]["hits"]
-        except Exception as e:
-            print(f"  Attempt {attempt + 1} failed: {e}", file=sys.stderr)
-            if attempt < 2:
-                time.sleep(2 ** (attempt + 1))
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - t0)
+
+    def timed_iter(self, stage, iterable):
+        """Yield from ``iterable``, charging the time taken to produce each
+        item to ``stage``."""
+        it = iter(iterable)
+        while True:
+            t0 = time.perf_counter()
+            try:
+                item = next(it)
+            except StopIteration:
+                self.add(stage, time.perf_counter() - t0, calls=0)
+                return
+            self.add(stage, time.perf_counter() - t0)
+            yield item
+
+    def as_dict(self):
+        return {
+            "stages": {
+                stage: {
+                    "seconds": round(self.seconds[stage], 6),
+                    "calls": self.calls[stage],
+                }
+                for stage in self.seconds
+            },
+            "counters": dict(self.counters),
+        }
+
+    def reset(self):
+        self.__init__()
+
+
+stats = RunStats()
+
+
+class _CountingReader:
+    """Binary file wrapper that counts the bytes read through it."""
+
+    def __init__(self, raw):
+        self._raw = raw
+
+    def read(self, size=-1):
+        data = self._raw.read() if size is None or size < 0 else self._raw.read(size)
+        stats.count("Bytes read", len(data))
+        return data
+
+    def close(self):
+        self._raw.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ---------------------------------------------------------------------------
+# Data fetching
+# ---------------------------------------------------------------------------
+
+
+class ResponseCache:
+    """On-disk cache of INSPIRE responses, keyed by URL and query parameters.
+
+    Entries holding an ETag or Last-Modified validator are revalidated with a
+    conditional request; entries without one are reused until ``ttl`` seconds
+    old.  In ``offline`` mode no requests are made and every lookup must be
+    served from the cache.  Bodies are kept in their own files so they can be
+    streamed back without loading them whole.
+    """
+
+    def __init__(self, cache_dir, ttl=DEFAULT_CACHE_TTL, offline=False):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.offline = offline
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def count(self, hit):
+        """Count a lookup served from the cache (``hit``) or downloaded;
+        locked, as --group fetches on several threads."""
+        with self._lock:
+            if hit:
+                self.hits += 1
             else:
+                self.misses += 1
+
+    @staticmethod
+    def key(url, params):
+        blob = json.dumps([url, sorted((params or {}).items())], default=str)
+        return hashlib.sha256(blob.encode()).hexdigest()
+
+    def _meta_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.meta.json")
+
+    def body_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.body")
+
+    def load(self, key):
+        """Return the entry's metadata, or None if it is not cached."""
+        try:
+            with open(self._meta_path(key)) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry if os.path.exists(self.body_path(key)) else None
+
+    def store(self, key, entry, chunks=None):
+        """Write ``entry`` metadata and, if given, the body from ``chunks``."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        if chunks is not None:
+            tmp = self.body_path(key) + ".tmp"
+            try:
+                with open(tmp, "wb") as f:
+                    for chunk in chunks:
+                        f.write(chunk)
+            except BaseException:
+                os.remove(tmp)
                 raise
+            os.replace(tmp, self.body_path(key))
+        tmp = self._meta_path(key) + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp, self._meta_path(key))
+
+    def open_body(self, key):
+        return open(self.body_path(key), "rb")
+
+    def is_fresh(self, entry):
+        return time.time() - entry.get("fetched_at", 0) < self.ttl
+
+
+class RetryPolicy:
+    """When, and for how long, to wait before retrying a failed request.
 
+    Connection errors, timeouts and RETRYABLE_STATUSES are retried with
+    full-jitter exponential backoff, or after the server's Retry-After if it
+    sent one; anything else is fatal.  Waits across the whole run are capped
+    at ``budget`` seconds, after which failures are no longer retried.
+    """
+
+    def __init__(
+        self,
+        attempts=DEFAULT_RETRY_ATTEMPTS,
+        budget=DEFAULT_RETRY_BUDGET,
+        base_delay=RETRY_BASE_DELAY,
+        max_delay=RETRY_MAX_DELAY,
+    ):
+        self.attempts = attempts
+        self.budget = budget
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.spent = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def retryable(exc):
+        requests = _requests()
+        if isinstance(exc, requests.HTTPError):
+            return (
+                exc.response is not None
+                and exc.response.status_code in RETRYABLE_STATUSES
+            )
+        # A body cut off mid-transfer is as transient as a dropped connection
+        return isinstance(
+            exc,
+            (
+                requests.ConnectionError,
+                requests.Timeout,
+                requests.exceptions.ChunkedEncodingError,
+                requests.exceptions.ContentDecodingError,
+            ),
+        )
 
-def fetch_bibtex(query, size=250):
-    """Fetch raw BibTeX string from INSPIRE."""
-    url = "https://inspirehep.net/api/literature"
+    @staticmethod
+    def retry_after(exc):
+        """Seconds requested by the response's Retry-After header, or None."""
+        resp = getattr(exc, "response", None)
+        value = resp.headers.get("Retry-After") if resp is not None else None
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        import email.utils
+
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, when.timestamp() - time.time())
+
+    def next_delay(self, attempt, exc):
+        """Seconds to wait before retrying after failed attempt number
+        ``attempt`` (1-based), or None if the request should not be retried."""
+        if attempt >= self.attempts or not self.retryable(exc):
+            return None
+        delay = self.retry_after(exc)
+        if delay is None:
+            delay = random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+        # Threads share the budget (--group), so check and spend it together
+        with self._lock:
+            if self.spent + delay > self.budget:
+                return None
+            self.spent += delay
+        return delay
+
+
+def _requests():
+    """The requests module, imported on first use."""
+    import requests
+
+    return requests
+
+
+_session = None
+_session_lock = threading.Lock()
+_pool_size = DEFAULT_POOL_SIZE
+_http_timeout = DEFAULT_HTTP_TIMEOUT
+_api_url = INSPIRE_API_URL
+_retry_policy = RetryPolicy()
+
+
+def configure_http(
+    pool_size=DEFAULT_POOL_SIZE,
+    timeout=DEFAULT_HTTP_TIMEOUT,
+    api_url=INSPIRE_API_URL,
+    retry_attempts=DEFAULT_RETRY_ATTEMPTS,
+    retry_budget=DEFAULT_RETRY_BUDGET,
+):
+    """Configure the shared keep-alive session used for all INSPIRE requests.
+    The session itself is created by the first request (see get_session).
+
+    ``api_url`` is the literature search endpoint; point it at a local
+    stand-in (see inspire_server.py) to run without the real INSPIRE.
+    ``retry_attempts`` and ``retry_budget`` configure the RetryPolicy.
+    """
+    global _session, _pool_size, _http_timeout, _api_url, _retry_policy
+    _session = None
+    _pool_size = pool_size
+    _http_timeout = timeout
+    _api_url = api_url
+    _retry_policy = RetryPolicy(attempts=retry_attempts, budget=retry_budget)
+
+
+def get_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            requests = _requests()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=_pool_size, pool_maxsize=_pool_size
+            )
+            _session = requests.Session()
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+
+def _get_with_retries(url, params, label="Request", headers=None, spool=None):
+    """GET ``url`` under the shared RetryPolicy, returning the response.
+
+    With ``spool``, the body is streamed and ``spool(resp)`` reads it within
+    the same attempt, so a connection dropped mid-body is retried like one
+    dropped before the headers; its result is returned instead of the
+    response.  Transient failures are retried; fatal ones (e.g. a 400 from
+    a malformed query) are raised at once.
+    """
+    session = get_session()
+    requests = _requests()
+    import urllib3
+
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            stats.count("Requests")
+            with stats.timer("HTTP request"):
+                resp = session.get(
+                    url,
+                    params=params,
+                    headers=headers,
+                    timeout=_http_timeout,
+                    stream=spool is not None,
+                )
+            if resp.status_code != 304:
+                resp.raise_for_status()
+            if spool is None:
+                return resp
+            with resp:
+                return spool(resp)
+        except (requests.RequestException, urllib3.exceptions.HTTPError) as exc:
+            e = exc
+            if not isinstance(e, requests.RequestException):
+                # Raw urllib3 errors from reading the body
+                e = requests.ConnectionError(exc)
+            delay = _retry_policy.next_delay(attempt, e)
+            if delay is None:
+                print(f"  {label} failed: {e}", file=sys.stderr)
+                stats.count("Failed requests")
+                if e is exc:
+                    raise
+                raise e from exc
+            print(
+                f"  {label} attempt {attempt} failed: {e}; retrying in {delay:.1f}s",
+                file=sys.stderr,
+            )
+            stats.count("Retries")
+            if isinstance(e, requests.HTTPError) and e.response.status_code == 429:
+                stats.count("Throttled")
+            with stats.timer("Retry wait"):
+                time.sleep(delay)
+
+
+def _spool_to_temp(resp):
+    """Read a response body into a temporary file (held in memory up to
+    SPOOL_MEMORY_SIZE), rewound for reading."""
+    f = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY_SIZE)
+    try:
+        for chunk in resp.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+            f.write(chunk)
+    except BaseException:
+        f.close()
+        raise
+    f.seek(0)
+    return f
+
+
+def fetch_stream(url, params, label="Request", cache=None):
+    """Return a binary file-like object over the body of ``url``.
+
+    The body is read in full under the retry policy before it is returned,
+    so parsing never sees a truncated page: without a cache it is spooled to
+    a temporary file, and with one it is spooled to the cache and read back
+    from disk.  Cached bodies are revalidated with
+    If-None-Match/If-Modified-Since where the server supplied validators,
+    and reused within the cache TTL where it did not.  If INSPIRE cannot be
+    reached, a stale cached body is returned rather than failing the run.
+    """
+    if cache is None:
+        return _CountingReader(
+            _get_with_retries(url, params, label, spool=_spool_to_temp)
+        )
+
+    key = cache.key(url, params)
+    entry = cache.load(key)
+    if cache.offline:
+        if entry is None:
+            raise RuntimeError(f"{label}: not in cache ({url}), cannot run --offline")
+        cache.count(hit=True)
+        return _CountingReader(cache.open_body(key))
+
+    headers = {}
+    if entry is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        if not headers and cache.is_fresh(entry):
+            cache.count(hit=True)
+            return _CountingReader(cache.open_body(key))
+
+    def _spool(resp):
+        """Store a changed body in the cache; False for a 304."""
+        if resp.status_code == 304:
+            return False
+        with stats.timer("Download to cache"):
+            cache.store(
+                key,
+                {
+                    "url": url,
+                    "params": params,
+                    "etag": resp.headers.get("ETag"),
+                    "last_modified": resp.headers.get("Last-Modified"),
+                    "fetched_at": time.time(),
+                },
+                resp.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+            )
+        return True
+
+    try:
+        changed = _get_with_retries(url, params, label, headers=headers, spool=_spool)
+    except Exception:
+        if entry is None:
+            raise
+        print(f"  {label}: INSPIRE unavailable, using cached response", file=sys.stderr)
+        cache.count(hit=True)
+        return _CountingReader(cache.open_body(key))
+
+    if changed:
+        cache.count(hit=False)
+    else:
+        cache.count(hit=True)
+        entry["fetched_at"] = time.time()
+        cache.store(key, entry)
+    return _CountingReader(cache.open_body(key))
+
+
+def _iter_search_page(stream):
+    """Parse one page of INSPIRE search results from a binary stream.
+
+    Yields ``("hit", hit)`` for each hit, then ``("next", url)`` with the
+    ``links.next`` URL (None on the last page).  With ijson installed the
+    page is parsed incrementally, so only one hit is materialised at a time;
+    otherwise the whole page is decoded with ``json.load``.
+    """
+    if ijson is None:
+        data = json.load(stream)
+        for hit in data["hits"]["hits"]:
+            yield "hit", hit
+        yield "next", data.get("links", {}).get("next")
+        return
+
+    next_url = None
+    builder = None
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == "hits.hits.item" and event == "end_map":
+                yield "hit", builder.value
+                builder = None
+        elif prefix == "hits.hits.item" and event == "start_map":
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+        elif prefix == "links.next" and event == "string":
+            next_url = value
+    yield "next", next_url
+
+
+def author_search(query, since=None):
+    """Build the INSPIRE search string for an author, optionally restricted to
+    records updated on or after the date ``since`` (YYYY-MM-DD)."""
+    q = f"a {query}"
+    if since:
+        q += f" and du >= {since}"
+    return q
+
+
+def recid_search(recids):
+    """Build an INSPIRE search string matching any of the control numbers."""
+    return " or ".join(f"recid:{r}" for r in recids)
+
+
+def fetch_citation_counts(recids, page_size=DEFAULT_PAGE_SIZE, cache=None):
+    """Return ``{control_number: citation_count}`` for ``recids``, fetched in
+    batched ``recid:a or recid:b ...`` queries.  As in Paper, a count INSPIRE
+    did not return is None."""
+    recids = sorted(recids)
+    counts = {}
+    for i in range(0, len(recids), RECID_BATCH_SIZE):
+        q = recid_search(recids[i : i + RECID_BATCH_SIZE])
+        for hit in iter_search_hits(q, page_size, cache=cache, fields=CITATION_FIELDS):
+            md = hit["metadata"]
+            counts[md["control_number"]] = md.get("citation_count")
+    return counts
+
+
+def iter_search_hits(
+    q, page_size=DEFAULT_PAGE_SIZE, max_records=None, cache=None, fields=None
+):
+    """Yield INSPIRE literature hits for search ``q``, following ``links.next``.
+
+    Hits are yielded as soon as each page arrives, so callers can start
+    formatting before the full listing has been downloaded.  At most
+    ``max_records`` hits are yielded (no limit if None).  Requests go through
+    ``cache`` (a ResponseCache) if given.  ``fields`` optionally restricts the
+    metadata returned for each hit.
+    """
+    url = _api_url
     params = {
-        "q": f"a {query}",
-        "size": size,
+        "q": q,
+        "size": page_size,
         "sort": "mostrecent",
-        "format": "bibtex",
     }
-    for attempt in range(3):
-        try:
-            resp = requests.get(url, params=params, timeout=60)
-            resp.raise_for_status()
-            return resp.text
-        except Exception as e:
-            print(f"  BibTeX attempt {attempt + 1} failed: {e}", file=sys.stderr)
-            if attempt < 2:
-                time.sleep(2 ** (attempt + 1))
-            else:
-                raise
+    if fields:
+        params["fields"] = ",".join(fields)
+    n_yielded = 0
+    page = 1
+    while url:
+        n_page = 0
+        next_url = None
+        with fetch_stream(url, params, label=f"Page {page}", cache=cache) as stream:
+            # Bodies are parsed from their spool or cache file while decoding
+            for kind, value in stats.timed_iter("Decode", _iter_search_page(stream)):
+                if kind == "next":
+                    next_url = value
+                    continue
+                if max_records is not None and n_yielded >= max_records:
+                    return
+                stats.count("Records decoded")
+                yield value
+                n_yielded += 1
+                n_page += 1
+        if not n_page:
+            return
+        # The "next" link already carries the query, size and page
+        url = next_url
+        params = None
+        page += 1
+
+
+def iter_papers_json(
+    query, page_size=DEFAULT_PAGE_SIZE, max_records=None, cache=None, since=None
+):
+    """Yield the author's INSPIRE literature hits (see ``iter_search_hits``),
+    restricted to the metadata fields that Paper reads."""
+    return iter_search_hits(
+        author_search(query, since), page_size, max_records, cache, Paper.FIELDS
+    )
+
+
+def fetch_papers_json(query, page_size=DEFAULT_PAGE_SIZE, max_records=None, cache=None):
+    """Fetch all papers from the INSPIRE JSON API."""
+    return list(iter_papers_json(query, page_size, max_records, cache))
+
+
+def poll_inspire(query, since, page_size=DEFAULT_PAGE_SIZE):
+    """Cheap change check for --watch, bypassing the response cache.
+
+    Returns ``(total, newest)``: the size of the author's listing, from a
+    one-record request, and the newest ``updated`` timestamp among records
+    updated on or after the date ``since``, listed by control number only.
+    Additions and removals change the total; any edit moves the timestamp.
+    Citation counts alone do not mark a record as updated, so they are
+    refreshed only when something else triggers a regeneration.
+    """
+    params = {"q": author_search(query), "size": 1, "fields": "control_number"}
+    resp = _get_with_retries(_api_url, params, label="Poll")
+    total = resp.json()["hits"]["total"]
+    newest = None
+    for hit in iter_search_hits(
+        author_search(query, since), page_size, fields=("control_number",)
+    ):
+        if newest is None or hit.get("updated", "") > newest:
+            newest = hit.get("updated", "")
+    return total, newest
+
+
+# ---------------------------------------------------------------------------
+# Local record store (delta sync)
+# ---------------------------------------------------------------------------
+
+
+class RecordStore:
+    """SQLite store of INSPIRE literature records, keyed by control number.
+
+    Each row holds a record's metadata, its INSPIRE ``updated`` timestamp and
+    its position in the author's "mostrecent" listing, so outputs can be
+    rebuilt without re-downloading unchanged records.  Parsed Papers are
+    kept in memory until the store next changes, so a long-running process
+    (--watch) does not re-decode unchanged records.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._papers = None
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS records (
+                control_number INTEGER PRIMARY KEY,
+                texkey TEXT,
+                updated TEXT,
+                position INTEGER,
+                metadata TEXT
+            );
+            CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT);
+            """)
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
+
+    def get_state(self, key):
+        row = self.db.execute(
+            "SELECT value FROM state WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_state(self, key, value):
+        self.db.execute(
+            "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    def control_numbers(self):
+        return {r[0] for r in self.db.execute("SELECT control_number FROM records")}
+
+    def upsert(self, hit):
+        self._papers = None
+        md = hit["metadata"]
+        self.db.execute(
+            """
+            INSERT INTO records (control_number, texkey, updated, metadata)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (control_number) DO UPDATE SET
+                texkey = excluded.texkey,
+                updated = excluded.updated,
+                metadata = excluded.metadata
+            """,
+            (
+                md["control_number"],
+                _first(md.get("texkeys", [])),
+                hit.get("updated", ""),
+                json.dumps(md),
+            ),
+        )
+
+    def set_order(self, control_numbers):
+        """Record the listing order, dropping records no longer listed."""
+        current = [
+            r[0]
+            for r in self.db.execute(
+                "SELECT control_number FROM records ORDER BY position"
+            )
+        ]
+        if current == list(control_numbers):
+            return
+        self._papers = None
+        self.db.execute("UPDATE records SET position = NULL")
+        self.db.executemany(
+            "UPDATE records SET position = ? WHERE control_number = ?",
+            [(i, cn) for i, cn in enumerate(control_numbers)],
+        )
+        self.db.execute("DELETE FROM records WHERE position IS NULL")
+
+    def set_citation_counts(self, counts):
+        """Patch ``{control_number: count}`` into the stored metadata.  INSPIRE
+        does not mark a record as updated when only its citations change."""
+        before = self.db.total_changes
+        self.db.executemany(
+            "UPDATE records SET metadata = json_set(metadata, '$.citation_count', ?) "
+            "WHERE control_number = ? "
+            "AND json_extract(metadata, '$.citation_count') IS NOT ?",
+            [(n, cn, n) for cn, n in counts.items()],
+        )
+        if self.db.total_changes != before:
+            self._papers = None
+
+    def papers(self):
+        """Return the stored records as Papers, in listing order."""
+        if self._papers is None:
+            rows = self.db.execute("SELECT metadata FROM records ORDER BY position")
+            self._papers = [Paper.from_metadata(json.loads(md)) for (md,) in rows]
+        return self._papers
+
+    def __len__(self):
+        return self.db.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+
+def sync_store(store, query, page_size=DEFAULT_PAGE_SIZE, cache=None, full=False):
+    """Bring ``store`` up to date with INSPIRE, returning the number of records
+    (re-)downloaded.
+
+    The first sync (or ``full=True``, or a change to ``Paper.FIELDS`` or
+    the API URL) downloads every record.  Later syncs
+    list only control numbers to pick up ordering and removals, then fetch
+    full metadata just for records updated since the newest ``updated``
+    timestamp already in the store, plus any listed record the store has
+    never seen.  The control-number listing also carries citation counts,
+    which are refreshed for every record.
+    """
+    # Stored records only hold the fields requested when they were fetched,
+    # so a change to Paper.FIELDS forces a full re-download
+    fields = ",".join(Paper.FIELDS)
+    if store.get_state("fields") != fields or store.get_state("api_url") != _api_url:
+        full = True
+    last_updated = None if full else store.get_state("last_updated")
+    since = last_updated[:10] if last_updated else None
+
+    # Records are written to the store as they arrive, so at most one page
+    # of full metadata is held in memory at a time
+    seen = set()
+
+    def _upsert(hit):
+        nonlocal last_updated
+        with stats.timer("Store write"):
+            store.upsert(hit)
+        seen.add(hit["metadata"]["control_number"])
+        if not last_updated or hit.get("updated", "") > last_updated:
+            last_updated = hit.get("updated", "")
+
+    if since:
+        citations = {
+            hit["metadata"]["control_number"]: hit["metadata"].get("citation_count")
+            for hit in iter_search_hits(
+                author_search(query), page_size, cache=cache, fields=CITATION_FIELDS
+            )
+        }
+        order = list(citations)
+        for hit in iter_papers_json(query, page_size, cache=cache, since=since):
+            _upsert(hit)
+        missing = sorted(set(order) - store.control_numbers())
+        for i in range(0, len(missing), RECID_BATCH_SIZE):
+            q = recid_search(missing[i : i + RECID_BATCH_SIZE])
+            for hit in iter_search_hits(q, page_size, cache=cache, fields=Paper.FIELDS):
+                _upsert(hit)
+        store.set_citation_counts(
+            {cn: n for cn, n in citations.items() if n is not None}
+        )
+    else:
+        order = []
+        for hit in iter_papers_json(query, page_size, cache=cache):
+            order.append(hit["metadata"]["control_number"])
+            _upsert(hit)
+
+    store.set_order(order)
+    if last_updated:
+        store.set_state("last_updated", last_updated)
+    store.set_state("fields", fields)
+    store.set_state("api_url", _api_url)
+    store.db.commit()
+    return len(seen)
 
 
 # ---------------------------------------------------------------------------
@@ -125,9 +1187,280 @@ def fetch_bibtex(query, size=250):
 # ---------------------------------------------------------------------------
 
 
+def _empty_mapping():
+    return dataclasses.field(default_factory=lambda: types.MappingProxyType({}))
+
+
+class ConfigError(ValueError):
+    """Raised when pubs_config.yaml is malformed."""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Config:
+    """Validated, read-only view of pubs_config.yaml.
+
+    List settings are held as frozensets/tuples and mappings as read-only
+    dicts, built once in ``from_dict`` so per-paper lookups are O(1) and
+    nothing needs re-defaulting.
+    """
+
+    author_query: str = "Oliver.H.E.Philcox.1"
+    highlight_author: str = None
+    contributing_author: frozenset = frozenset()
+    exclude: frozenset = frozenset()
+    selected_papers: frozenset = frozenset()
+    overrides: types.MappingProxyType = _empty_mapping()
+    author_name_overrides: types.MappingProxyType = _empty_mapping()
+    title_overrides: types.MappingProxyType = _empty_mapping()
+    journal_map: types.MappingProxyType = _empty_mapping()
+    extra_major_author: tuple = ()
+    other_works: str = ""
+    output_pubstex: str = None
+    output_pubstex_ci: str = None
+    output_bibtex: str = "../_bibliography/papers.bib"
+    output_citations: str = "../_data/citations.json"
+    output_publications: str = "../_data/publications.json"
+    page_size: int = DEFAULT_PAGE_SIZE
+    max_records: int = None
+    cache_dir: str = DEFAULT_CACHE_DIR
+    cache_ttl: int = DEFAULT_CACHE_TTL
+    record_store: str = DEFAULT_RECORD_STORE
+    render_manifest: str = DEFAULT_RENDER_MANIFEST
+    http_pool_size: int = DEFAULT_POOL_SIZE
+    http_timeout: int = DEFAULT_HTTP_TIMEOUT
+    api_url: str = INSPIRE_API_URL
+    retry_attempts: int = DEFAULT_RETRY_ATTEMPTS
+    retry_budget: int = DEFAULT_RETRY_BUDGET
+    watch_interval: int = DEFAULT_WATCH_INTERVAL
+    watch_max_interval: int = DEFAULT_WATCH_MAX_INTERVAL
+
+    @classmethod
+    def from_dict(cls, data):
+        """Validate a parsed YAML mapping, raising ConfigError listing every
+        problem found."""
+        data = data or {}
+        if not isinstance(data, dict):
+            raise ConfigError("config must be a mapping")
+        fields = {f.name: f for f in dataclasses.fields(cls)}
+        errors = []
+        for key in data:
+            if key not in fields:
+                errors.append(f"unknown key '{key}'")
+
+        def _check(key, kind, name, items=None):
+            """Whether ``key`` is set and is a ``kind``, whose elements (if
+            ``items`` maps the value to them) are all strings."""
+            value = data.get(key)
+            if value is None:
+                return False
+            # bool is an int, but "page_size: true" is not a page size
+            ok = isinstance(value, kind) and not isinstance(value, bool)
+            if ok and items is not None:
+                ok = all(isinstance(item, str) for item in items(value))
+            if not ok:
+                errors.append(f"'{key}' must be {name}")
+            return ok
+
+        values = {}
+        for key in ("contributing_author", "exclude", "selected_papers"):
+            if _check(key, list, "a list of texkeys", list):
+                values[key] = frozenset(data[key])
+        if _check("extra_major_author", list, "a list of strings", list):
+            values["extra_major_author"] = tuple(data["extra_major_author"])
+        for key in ("author_name_overrides", "title_overrides", "journal_map"):
+            if _check(key, dict, "a mapping of strings", lambda m: [*m, *m.values()]):
+                values[key] = types.MappingProxyType(dict(data[key]))
+        for key in (
+            "author_query",
+            "highlight_author",
+            "other_works",
+            "output_pubstex",
+            "output_pubstex_ci",
+            "output_bibtex",
+            "output_citations",
+            "output_publications",
+            "cache_dir",
+            "record_store",
+            "render_manifest",
+            "api_url",
+        ):
+            if _check(key, str, "a string"):
+                values[key] = data[key]
+        for key, minimum in (
+            ("page_size", 1),
+            ("max_records", 1),
+            ("cache_ttl", 0),
+            ("http_pool_size", 1),
+            ("http_timeout", 1),
+            ("retry_attempts", 1),
+            ("retry_budget", 0),
+            ("watch_interval", 1),
+            ("watch_max_interval", 1),
+        ):
+            if _check(key, int, "an integer"):
+                if data[key] < minimum:
+                    errors.append(f"'{key}' must be at least {minimum}")
+                values[key] = data[key]
+
+        if _check("overrides", dict, "a mapping"):
+            overrides = {}
+            for texkey, ovr in data["overrides"].items():
+                if not isinstance(ovr, dict):
+                    errors.append(f"overrides['{texkey}'] must be a mapping")
+                    continue
+                ovr = dict(ovr)
+                for k, v in ovr.items():
+                    if k not in OVERRIDE_KEYS:
+                        errors.append(f"overrides['{texkey}']: unknown key '{k}'")
+                    elif (
+                        k in OVERRIDE_NUMERIC_KEYS
+                        and isinstance(v, int)
+                        and not isinstance(v, bool)
+                    ):
+                        ovr[k] = str(v)
+                    elif not isinstance(v, str):
+                        errors.append(f"overrides['{texkey}']['{k}'] must be a string")
+                status = ovr.get("status")
+                if status is not None and status not in OVERRIDE_STATUSES:
+                    errors.append(
+                        f"overrides['{texkey}']: bad status '{status}' "
+                        f"(expected one of: {', '.join(sorted(OVERRIDE_STATUSES))})"
+                    )
+                overrides[texkey] = types.MappingProxyType(ovr)
+            values["overrides"] = types.MappingProxyType(overrides)
+
+        both = values.get("exclude", frozenset()) & values.get(
+            "contributing_author", frozenset()
+        )
+        for texkey in sorted(both):
+            errors.append(
+                f"'{texkey}' is both excluded and a contributing-author paper"
+            )
+
+        if errors:
+            raise ConfigError("invalid config:\n  " + "\n  ".join(errors))
+        return cls(**values)
+
+    def highlight_surname(self):
+        """Surname set in bold in author lists: ``highlight_author``, or the
+        surname in ``author_query`` ('Oliver.H.E.Philcox.1' -> 'Philcox')."""
+        if self.highlight_author is not None:
+            return self.highlight_author
+        parts = self.author_query.split(".")
+        if len(parts) > 1 and parts[-1].isdigit():
+            parts.pop()
+        return parts[-1] or None
+
+    def referenced_texkeys(self):
+        """Every texkey the config refers to."""
+        return (
+            self.contributing_author
+            | self.exclude
+            | self.selected_papers
+            | set(self.overrides)
+            | set(self.title_overrides)
+        )
+
+    def check_texkeys(self, texkeys):
+        """Warn about config texkeys that match none of ``texkeys``."""
+        for texkey in sorted(self.referenced_texkeys() - set(texkeys)):
+            print(
+                f"  Warning: config refers to '{texkey}', "
+                "which matches no fetched paper",
+                file=sys.stderr,
+            )
+
+
+def _yaml_load(text, name):
+    """Parse YAML with PyYAML's libyaml-backed CSafeLoader where available,
+    raising ConfigError for malformed files."""
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        return yaml.load(text, Loader=loader)
+    except yaml.YAMLError as e:
+        raise ConfigError(f"{name}: invalid YAML: {e}") from e
+
+
+def _config_cache_path(path):
+    directory, name = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, f".{name}.cache.json")
+
+
+def _read_config_cache(cache_path):
+    try:
+        with open(cache_path) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("version") != CONFIG_CACHE_VERSION:
+        return None
+    return cached
+
+
+def _write_config_cache(cache_path, mtime_ns, size, digest, data):
+    # Only plain data that survives a JSON round trip unchanged is cached
+    # (YAML can also produce dates, sets, non-string keys...)
+    try:
+        encoded = json.dumps(data)
+    except (TypeError, ValueError):
+        return
+    if json.loads(encoded) != data:
+        return
+    cached = {
+        "version": CONFIG_CACHE_VERSION,
+        "mtime_ns": mtime_ns,
+        "size": size,
+        "checked_ns": time.time_ns(),
+        "sha256": digest,
+        "data": data,
+    }
+    tmp = cache_path + ".tmp"
+    try:
+        with open(tmp, "w") as f:
+            json.dump(cached, f)
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass
+
+
 def load_config(path):
-    with open(path) as f:
-        return yaml.safe_load(f)
+    """Load and validate the YAML config at ``path``."""
+    return Config.from_dict(_load_config_data(path))
+
+
+def _load_config_data(path):
+    """The parsed YAML mapping in the config at ``path``.
+
+    The parsed YAML is cached as JSON in ``.<name>.cache.json`` beside the
+    config.  It is reused without reading the config when the file's mtime
+    and size match, or after re-hashing when only the mtime changed (e.g. a
+    fresh checkout), so YAML is parsed only when the content changes.
+    """
+    st = os.stat(path)
+    cache_path = _config_cache_path(path)
+    cached = _read_config_cache(cache_path)
+    # As with git's index, an mtime is only trusted if the file was already
+    # older than the filesystem's timestamp resolution when it was hashed;
+    # otherwise a same-size edit in the same tick could go unnoticed
+    if (
+        cached
+        and cached["mtime_ns"] == st.st_mtime_ns
+        and cached["size"] == st.st_size
+        and st.st_mtime_ns + CONFIG_MTIME_SLACK_NS < cached["checked_ns"]
+    ):
+        return cached["data"]
+
+    with open(path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+    if cached and cached["sha256"] == digest:
+        data = cached["data"]
+    else:
+        data = _yaml_load(raw, path)
+    _write_config_cache(cache_path, st.st_mtime_ns, len(raw), digest, data)
+    return data
 
 
 # ---------------------------------------------------------------------------
@@ -135,33 +1468,131 @@ def load_config(path):
 # ---------------------------------------------------------------------------
 
 
-def get_texkey(paper):
-    keys = paper.get("texkeys", [])
-    return keys[0] if keys else ""
+def _first(items, key=None):
+    """First element of an INSPIRE list field (or its ``key``), else ''."""
+    if not items:
+        return ""
+    return items[0].get(key, "") if key else items[0]
+
+
+def _field_getter(paths, build):
+    """Return a function building one Paper attribute from a record's
+    metadata by passing the INSPIRE field ``paths`` to ``build``.
+    Top-level fields are passed as they are; a subfield of a list field
+    (``dois.value``) as the list of its values, and several subfields of
+    one list field (``titles.title``, ``titles.source``) as a list of
+    tuples, one per item."""
+    heads = {path.partition(".")[0] for path in paths}
+    keys = [path.partition(".")[2] for path in paths]
+    if not any(keys):
+        if len(paths) == 1:
+            (path,) = paths
+            return lambda md: build(md.get(path))
+        return lambda md: build(*[md.get(path) for path in paths])
+    if len(heads) != 1 or not all(keys):
+        raise ValueError(f"Paper fields must share one list field: {paths}")
+    (head,) = heads
+    if len(keys) == 1:
+        (key,) = keys
+        return lambda md: build([item.get(key, "") for item in md.get(head) or ()])
+    return lambda md: build([tuple(map(item.get, keys)) for item in md.get(head) or ()])
+
+
+def _arxiv_title(titles):
+    for title, source in titles:
+        if (source or "").lower() == "arxiv":
+            return title or ""
+    return None
+
+
+def _pub_info(pub_infos):
+    pi = pub_infos[0] if pub_infos else {}
+    return {k: pi[k] for k in PUB_INFO_KEYS if k in pi}
+
+
+# Paper attribute -> (INSPIRE fields it reads, builder from their values).
+# Paper.FIELDS, the API's ``fields=`` projection, and Paper.from_metadata
+# are both derived from this table, so they cannot drift apart.
+PAPER_SOURCES = {
+    "control_number": (("control_number",), lambda cn: cn),
+    "texkey": (("texkeys",), _first),
+    "title": (("titles.title",), lambda titles: titles[0] if titles else None),
+    "arxiv_title": (("titles.title", "titles.source"), _arxiv_title),
+    "authors": (("authors.full_name",), tuple),
+    "arxiv_id": (("arxiv_eprints.value",), _first),
+    "arxiv_category": (
+        ("arxiv_eprints.categories",),
+        lambda categories: _first(categories[0]) if categories else "",
+    ),
+    "doi": (("dois.value",), _first),
+    "pub_info": (("publication_info",), _pub_info),
+    "collaboration": (("collaborations.value",), _first),
+    "report_number": (("report_numbers.value",), _first),
+    "document_type": (("document_type",), _first),
+    "date": (
+        ("preprint_date", "earliest_date"),
+        lambda preprint, earliest: preprint or earliest or "",
+    ),
+    "citation_count": (("citation_count",), lambda count: count),
+}
+_PAPER_GETTERS = [
+    _field_getter(paths, build) for paths, build in PAPER_SOURCES.values()
+]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Paper:
+    """The parts of an INSPIRE literature record that the formatters use.
+
+    Built once per record as the response is parsed (``Paper.from_metadata``),
+    so the full metadata dict, with its references, affiliations and
+    documents, can be dropped immediately.
+    """
+
+    control_number: int
+    texkey: str
+    title: str  # default (journal) title; None if the record has no titles
+    arxiv_title: str  # arXiv-source title, or None
+    authors: tuple  # author full_name strings, in INSPIRE order
+    arxiv_id: str
+    arxiv_category: str
+    doi: str
+    pub_info: dict  # first publication_info entry, restricted to PUB_INFO_KEYS
+    collaboration: str
+    report_number: str
+    document_type: str
+    date: str  # preprint (or earliest) date, YYYY-MM-DD
+    citation_count: int  # None if the record did not include it
+
+    # The INSPIRE metadata fields read by from_metadata, requested via the
+    # API's ``fields=`` parameter so nothing else is downloaded
+    FIELDS = tuple(
+        dict.fromkeys(path for paths, _ in PAPER_SOURCES.values() for path in paths)
+    )
+
+    @classmethod
+    def from_metadata(cls, md):
+        """Build a Paper from a record's metadata, reading only FIELDS."""
+        return cls(*[get(md) for get in _PAPER_GETTERS])
+
+
+# from_metadata passes the PAPER_SOURCES values positionally
+if list(PAPER_SOURCES) != [field.name for field in dataclasses.fields(Paper)]:
+    raise RuntimeError("PAPER_SOURCES must list every Paper attribute, in order")
 
 
 def get_arxiv_id(paper, config=None):
-    texkey = get_texkey(paper)
     # Check override first
     if config:
-        ovr = config.get("overrides", {}).get(texkey, {})
+        ovr = config.overrides.get(paper.texkey, {})
         if "arxiv_id" in ovr:
             return ovr["arxiv_id"]
-    eprints = paper.get("arxiv_eprints", [])
-    if eprints:
-        return eprints[0].get("value", "")
-    return ""
-
-
-def get_doi(paper):
-    dois = paper.get("dois", [])
-    if dois:
-        return dois[0].get("value", "")
-    return ""
+    return paper.arxiv_id
 
 
-def is_philcox_author(full_name):
-    return "Philcox" in full_name
+def is_highlighted_author(full_name, surname):
+    """Whether INSPIRE 'Last, First' ``full_name`` has surname ``surname``."""
+    return surname is not None and full_name.partition(",")[0].strip() == surname
 
 
 # ---------------------------------------------------------------------------
@@ -170,71 +1601,120 @@ def is_philcox_author(full_name):
 
 
 def unicode_to_latex(text):
-    for char, latex in UNICODE_TO_LATEX.items():
-        text = text.replace(char, latex)
-    return text
-
-
-def format_author_name(full_name, author_overrides=None):
-    """Convert INSPIRE 'Last, First Middle' to 'Last, F.\\,M.' format."""
-    if is_philcox_author(full_name):
-        return PHILCOX_BOLD
-
-    # Check for explicit override
-    if author_overrides and full_name in author_overrides:
-        return author_overrides[full_name]
-
-    parts = full_name.split(",", 1)
-    if len(parts) != 2:
+    if text.isascii():
+        return text
+    return text.translate(_UNICODE_TRANS)
+
+
+def _initials(token):
+    """'Shi-Fan' -> 'S.-F.', 'M.' -> 'M.', 'J.C.' -> 'J.\\,C.'."""
+    if "-" in token:
+        return "-".join(hp[0] + "." for hp in token.split("-") if hp)
+    if token.endswith(".") and len(token) > 2 and "." in token[:-1]:
+        # Run-together initials
+        return "\\,".join(p + "." for p in token[:-1].split(".") if p)
+    if len(token) <= 2 and token.endswith("."):
+        return token
+    return token[0] + "."
+
+
+@functools.lru_cache(maxsize=AUTHOR_NAME_CACHE_SIZE)
+def _format_author_name(full_name, override, highlight):
+    if is_highlighted_author(full_name, highlight):
+        return f"\\textbf{{{_format_author_name(full_name, override, None)}}}"
+    if override is not None:
+        return override
+
+    parts = [p.strip() for p in full_name.split(",")]
+    if len(parts) < 2:
         return unicode_to_latex(full_name)
-
-    last_name = unicode_to_latex(parts[0].strip())
-    first_names_str = parts[1].strip()
-
-    # Split first names on whitespace
-    name_tokens = first_names_str.split()
-    initials = []
-    for token in name_tokens:
-        if "-" in token:
-            # Hyphenated: "Shi-Fan" -> "S.-F."
-            hyph_parts = token.split("-")
-            hyph_inits = []
-            for hp in hyph_parts:
-                if hp:
-                    hyph_inits.append(hp[0] + ".")
-            initials.append("-".join(hyph_inits))
-        elif len(token) <= 2 and token.endswith("."):
-            # Already an initial like "M."
-            initials.append(token)
-        else:
-            initials.append(token[0] + ".")
-
-    formatted = "\\,".join(initials)
-    return f"{last_name}, {formatted}"
+    suffix = ""
+    if len(parts) > 2 and parts[-1] in NAME_SUFFIXES:
+        suffix = parts.pop()
+    last_name = parts[0]
+    name_tokens = ", ".join(parts[1:]).replace(",", " ").split()
+    if not suffix and len(name_tokens) > 1 and name_tokens[-1] in NAME_SUFFIXES:
+        suffix = name_tokens.pop()
+
+    # A particle after the first given name starts the rest of the surname:
+    # "Ribeiro, Jose da Silva" -> "da Silva Ribeiro"
+    for i in range(1, len(name_tokens)):
+        if name_tokens[i] in NAME_PARTICLES:
+            last_name = " ".join(name_tokens[i:] + [last_name])
+            del name_tokens[i:]
+            break
+
+    formatted = unicode_to_latex("\\,".join(_initials(t) for t in name_tokens))
+    result = f"{unicode_to_latex(last_name)}, {formatted}"
+    if suffix:
+        result += f", {suffix}"
+    return result
+
+
+def format_author_name(full_name, author_overrides=None, highlight=None):
+    """Convert INSPIRE 'Last, First Middle' to 'Last, F.\\,M.' format, in
+    bold if the surname is ``highlight``.
+
+    Results are memoised on the raw name plus its override, so collaborators
+    shared between papers are only formatted once per run.
+    """
+    override = author_overrides.get(full_name) if author_overrides else None
+    return _format_author_name(full_name, override, highlight)
 
 
 # ---------------------------------------------------------------------------
-# Alphabetization detection
+# Author list scan
 # ---------------------------------------------------------------------------
 
 
-def detect_alphabetized(authors):
-    """Check if author last names are approximately alphabetically sorted."""
-    if len(authors) <= 1:
-        return False
-    last_names = []
-    for a in authors:
-        name = a.get("full_name", "")
-        ln = name.split(",")[0].strip().lower()
-        last_names.append(ln)
-    n = len(last_names)
-    if n <= 20:
-        return last_names == sorted(last_names)
+def scan_authors(authors, highlight=None, window=CONTRIB_AUTHOR_TRUNCATE):
+    """Single pass over an author list for the pubs.tex item prefix.
+
+    ``authors`` is a sequence of INSPIRE 'Last, First' full names.  Returns
+    ``(alphabetized, highlight_pos)`` where ``alphabetized`` says whether the
+    surnames are (approximately, for long lists) in alphabetical order and
+    ``highlight_pos`` is the index of the author with surname ``highlight``
+    if it falls within the first ``window`` authors, else None.
+
+    The walk stops as soon as both answers are settled: the highlight search
+    never looks past ``window``, and the sortedness test ends once the
+    threshold has been reached or can no longer be met.
+    """
+    n = len(authors)
+    if n <= 1:
+        needed = None  # never alphabetized
+    elif n <= 20:
+        needed = n - 1  # every adjacent pair in order
     else:
-        sorted_pairs = sum(
-            1 for i in range(n - 1) if last_names[i] <= last_names[i + 1]
-        )
-        return sorted_pairs >= 0.8 * (n - 1)
+        needed = math.ceil(0.8 * (n - 1))
+    max_unsorted = 0 if needed is None else (n - 1) - needed
+
+    alphabetized = False if needed is None else None
+    highlight_pos = None
+    in_order = out_of_order = 0
+    prev = None
+    for i, name in enumerate(authors):
+        if (
+            i < window
+            and highlight_pos is None
+            and is_highlighted_author(name, highlight)
+        ):
+            highlight_pos = i
+        if alphabetized is None:
+            key = name.partition(",")[0].strip().lower()
+            if prev is not None:
+                if prev <= key:
+                    in_order += 1
+                else:
+                    out_of_order += 1
+                if in_order >= needed:
+                    alphabetized = True
+                elif out_of_order > max_unsorted:
+                    alphabetized = False
+            prev = key
+        if alphabetized is not None and (highlight_pos is not None or i >= window - 1):
+            break
+    return bool(alphabetized), highlight_pos
 
 
 # ---------------------------------------------------------------------------
@@ -244,9 +1724,9 @@ def detect_alphabetized(authors):
 
 def classify_paper(texkey, config):
     """Return 'major', 'contributing', or 'exclude'."""
-    if texkey in config.get("exclude", []):
+    if texkey in config.exclude:
         return "exclude"
-    if texkey in config.get("contributing_author", []):
+    if texkey in config.contributing_author:
         return "contributing"
     return "major"
 
@@ -256,96 +1736,255 @@ def classify_paper(texkey, config):
 # ---------------------------------------------------------------------------
 
 
-def _mathml_to_latex(text):
-    """Convert simple MathML fragments in INSPIRE titles to LaTeX."""
+# ``<tag ...>``, ``</tag>``, ``<tag/>`` or a run of text; namespace prefixes
+# (``mml:``) are dropped
+_MATHML_TOKEN_RE = re.compile(r"<(/?)(?:[\w.-]+:)?([A-Za-z][\w.-]*)[^>]*?(/?)>|([^<]+)")
+_MATH_RE = re.compile(r"<(?:[\w.-]+:)?math\b[^>]*>.*?</(?:[\w.-]+:)?math>", re.DOTALL)
+_CONTROL_WORD_END_RE = re.compile(r"\\[A-Za-z]+$")
+_GREEK_WORD_RE = re.compile(
+    "(" + "|".join(re.escape(latex) for latex in set(GREEK_TO_LATEX.values())) + ")"
+    r"(?:\{\\rm ([A-Za-z]+)\}|\\mbox\{([A-Za-z]+)\})"
+)
+
+
+def _mathml_tokens(fragment):
+    """Yield ``("open", tag)``, ``("close", tag)`` and ``("text", text)``
+    tokens from a MathML fragment, in one scan.  Whitespace between tags is
+    dropped and entities (``&#x3b1;``, ``&alpha;``) are decoded."""
+    for m in _MATHML_TOKEN_RE.finditer(fragment):
+        closing, tag, empty, text = m.groups()
+        if text is not None:
+            text = text.strip()
+            if text:
+                if "&" in text:
+                    text = html.unescape(text)
+                yield "text", text
+        elif closing:
+            yield "close", tag
+        else:
+            yield "open", tag
+            if empty:
+                yield "close", tag
 
-    def _convert_math(m):
-        inner = m.group(1)
-        # Handle subscripts: <msub><mi>f</mi><mrow><mi>NL</mi></mrow></msub>
-        inner = re.sub(
-            r"<msub>\s*<mi>([^<]*)</mi>\s*<mrow>\s*<mi>([^<]*)</mi>\s*</mrow>\s*</msub>",
-            r"\1_{\\rm \2}",
-            inner,
-        )
-        inner = re.sub(
-            r"<msub>\s*<mi>([^<]*)</mi>\s*<mn>([^<]*)</mn>\s*</msub>",
-            r"\1_{\2}",
-            inner,
-        )
-        # Strip all remaining tags
-        inner = re.sub(r"<[^>]+>", "", inner)
-        inner = inner.strip()
-        # If the result is just a word (no math operators), use \textit
-        if re.match(r"^[A-Za-z]+$", inner) and len(inner) > 2:
-            return f"\\textit{{{inner}}}"
-        return f"${inner}$"
-
-    text = re.sub(
-        r"<math[^>]*>(.*?)</math>", _convert_math, text, flags=re.DOTALL
-    )
-    return text
-
-
-def _fix_title_unicode(title):
-    """Fix unicode characters in titles that should be LaTeX."""
-    title = re.sub(r"\$?\u039bCDM\$?", r"$\\Lambda$CDM", title)  # ΛCDM (handle surrounding $)
-    title = re.sub(r"\$?\u039b\$?", r"$\\Lambda$", title)  # standalone Λ (handle surrounding $)
-    title = title.replace("\u03b1", "$\\alpha$")  # α
-    title = title.replace("\u03b2", "$\\beta$")  # β
-    title = title.replace("\u03b3", "$\\gamma$")  # γ
-    title = title.replace("\u2013", "--")  # en-dash
-    title = title.replace("\u2014", "---")  # em-dash
-    title = title.replace("\u2019", "'")  # right single quote
-    title = title.replace("\u2018", "`")  # left single quote
-    title = title.replace("\u201c", "``")  # left double quote
-    title = title.replace("\u201d", "''")  # right double quote
-    # Escape bare % but avoid double-escaping already-escaped \%
-    title = re.sub(r"(?<!\\)%", r"\\%", title)
-    # Fix \LambdaCDM -> $\Lambda$CDM (handle optional surrounding $)
-    title = re.sub(r"\$?\\LambdaCDM\$?", r"$\\Lambda$CDM", title)
-    return title
-
-
-def _get_arxiv_title(paper):
-    """Get the arXiv-source title if available."""
-    for t in paper.get("titles", []):
-        if t.get("source", "").lower() == "arxiv":
-            return t.get("title", "")
-    return None
+
+def _math_symbols(text):
+    return "".join(GREEK_TO_LATEX.get(c, MATHML_OPERATORS.get(c, c)) for c in text)
+
+
+def _concat(parts):
+    """Join LaTeX pieces, keeping a control word from running into a
+    following letter (``\\alpha`` + ``x``)."""
+    out = ""
+    for part in parts:
+        if part and out and part[0].isalpha() and _CONTROL_WORD_END_RE.search(out):
+            out += " "
+        out += part
+    return out
+
+
+def _is_group(latex):
+    """Whether ``latex`` is a single brace group such as ``{\\rm NL}``."""
+    if not (latex.startswith("{") and latex.endswith("}")):
+        return False
+    depth = 0
+    for i, c in enumerate(latex):
+        depth += (c == "{") - (c == "}")
+        if depth == 0 and i < len(latex) - 1:
+            return False
+    return True
+
+
+def _atom(latex):
+    """Brace ``latex`` for use as a script base, unless it already is one
+    character, one control word or one group."""
+    if len(latex) == 1 or _CONTROL_WORD_END_RE.fullmatch(latex) or _is_group(latex):
+        return latex
+    return "{" + latex + "}"
+
+
+def _arg(latex):
+    """``latex`` as the braced argument of a script or command, without
+    doubling an existing group: ``{\\rm NL}`` -> ``{\\rm NL}``, ``8`` -> ``{8}``."""
+    return latex if _is_group(latex) else "{" + latex + "}"
+
+
+def _mathml_mi(parts):
+    text = "".join(parts)
+    if len(text) == 1:
+        return _math_symbols(text)
+    if text in MATHML_FUNCTIONS:
+        return "\\" + text
+    # A leading Greek letter stays a symbol: ΛCDM -> \Lambda{\rm CDM}
+    if text[0] in GREEK_TO_LATEX:
+        return _concat([GREEK_TO_LATEX[text[0]], _mathml_mi([text[1:]])])
+    return "{\\rm " + _concat([_math_symbols(c) for c in text]) + "}"
+
+
+def _mathml_mtext(parts):
+    text = re.sub(r"(?<!\\)([%&#])", r"\\\1", " ".join(parts))
+    return "\\mbox{" + text + "}"
+
+
+def _mathml_scripts(parts, sub, sup):
+    base = _atom(parts[0])
+    return (
+        base
+        + (f"_{_arg(parts[sub])}" if sub else "")
+        + (f"^{_arg(parts[sup])}" if sup else "")
+    )
+
+
+def _mathml_mover(parts):
+    accent = MATHML_ACCENTS.get(parts[1])
+    if accent:
+        return accent + _arg(parts[0])
+    return _mathml_scripts(parts, 0, 1)
+
+
+# Tag -> (number of child elements expected, builder from their LaTeX).
+# Other tags (math, mrow, mstyle, unknown ones...) just concatenate their
+# children, as do these if the child count is wrong.
+_MATHML_BUILDERS = {
+    "mi": (None, _mathml_mi),
+    "mn": (None, lambda parts: _math_symbols("".join(parts))),
+    "mo": (None, lambda parts: _math_symbols("".join(parts))),
+    "mtext": (None, _mathml_mtext),
+    "msub": (2, lambda parts: _mathml_scripts(parts, 1, 0)),
+    "munder": (2, lambda parts: _mathml_scripts(parts, 1, 0)),
+    "msup": (2, lambda parts: _mathml_scripts(parts, 0, 1)),
+    "mover": (2, _mathml_mover),
+    "msubsup": (3, lambda parts: _mathml_scripts(parts, 1, 2)),
+    "munderover": (3, lambda parts: _mathml_scripts(parts, 1, 2)),
+    "mfrac": (2, lambda parts: f"\\frac{_arg(parts[0])}{_arg(parts[1])}"),
+    "msqrt": (None, lambda parts: f"\\sqrt{_arg(_concat(parts))}"),
+    "mroot": (2, lambda parts: f"\\sqrt[{parts[1]}]{_arg(parts[0])}"),
+}
+
+# Elements whose content is not rendered
+_MATHML_SKIPPED = frozenset(["annotation", "annotation-xml", "none", "mprescripts"])
+
+# Token elements, whose text their builder converts itself
+_MATHML_TOKEN_ELEMENTS = frozenset(["mi", "mn", "mo", "mtext"])
+
+
+def _mathml_element(tokens, tag):
+    """Convert the element ``tag``, whose open tag has just been read, by
+    consuming ``tokens`` up to its close tag."""
+    parts = []
+    for kind, value in tokens:
+        if kind == "open":
+            part = _mathml_element(tokens, value)
+            if value not in _MATHML_SKIPPED:
+                parts.append(part)
+        elif kind == "text":
+            parts.append(
+                value if tag in _MATHML_TOKEN_ELEMENTS else _math_symbols(value)
+            )
+        else:
+            break
+    arity, build = _MATHML_BUILDERS.get(tag, (None, None))
+    if build is None or (arity is not None and len(parts) != arity):
+        return _concat(parts)
+    return build(parts)
+
+
+@functools.lru_cache(maxsize=MATHML_CACHE_SIZE)
+def _convert_math(fragment):
+    """Convert one ``<math>...</math>`` fragment to LaTeX, e.g.
+    ``<msub><mi>f</mi><mrow><mi>NL</mi></mrow></msub>`` -> ``$f_{\\rm NL}$``.
+    A fragment that is just a word (an italicised name such as Planck)
+    becomes ``\\textit{...}``.  Cached, as the same fragments recur across
+    titles."""
+    tokens = _mathml_tokens(fragment)
+    for kind, tag in tokens:
+        if kind == "open":
+            break
+    latex = _mathml_element(tokens, tag).strip()
+    if re.fullmatch(r"\{\\rm [A-Za-z]{3,}\}", latex):
+        return f"\\textit{{{latex[5:-1]}}}"
+    # A Greek letter prefixing a word (ΛCDM, as <mi>ΛCDM</mi> or
+    # <mi>Λ</mi><mtext>CDM</mtext>) is written as in plain-text titles
+    m = _GREEK_WORD_RE.fullmatch(latex)
+    if m:
+        return f"${m.group(1)}${m.group(2) or m.group(3)}"
+    return f"${latex}$"
+
+
+# One alternation covering every title substitution, so each title is
+# scanned once: ΛCDM / \LambdaCDM (with any surrounding $), other Greek
+# letters (with any surrounding $), typographic punctuation, {\&}, and
+# bare % or & (not already escaped).
+_TITLE_RE = re.compile(
+    r"(?P<lcdm>\$?(?:ΛCDM|\\LambdaCDM)\$?)"
+    r"|\$?(?P<greek>[" + "".join(GREEK_TO_LATEX) + r"])\$?"
+    r"|(?P<punct>[" + "".join(TITLE_PUNCTUATION) + r"])"
+    r"|(?P<amp>\{\\&\})"
+    r"|(?<!\\)(?P<special>[%&])"
+)
+
+
+def _title_sub(m):
+    kind = m.lastgroup
+    if kind == "lcdm":
+        return r"$\Lambda$CDM"
+    if kind == "greek":
+        return f"${GREEK_TO_LATEX[m.group('greek')]}$"
+    if kind == "punct":
+        return TITLE_PUNCTUATION[m.group("punct")]
+    if kind == "amp":
+        return r"\&"
+    return "\\" + m.group("special")
+
+
+def normalize_title(title):
+    """Convert Unicode Greek letters and punctuation in a title to LaTeX and
+    escape bare % and &, in a single pass."""
+    return _TITLE_RE.sub(_title_sub, title)
+
+
+def title_to_latex(title):
+    """Convert MathML fragments in an INSPIRE title to LaTeX, and normalise
+    the text around them with ``normalize_title``; converted math is not
+    normalised again.
+
+    >>> title_to_latex("Beyond <math><mi>ΛCDM</mi></math> & ΛCDM")
+    'Beyond $\\\\Lambda$CDM \\\\& $\\\\Lambda$CDM'
+    >>> title_to_latex("<math><mi>Λ</mi><mtext>CDM</mtext></math> at 1%")
+    '$\\\\Lambda$CDM at 1\\\\%'
+    """
+    if "math" not in title:
+        return normalize_title(title)
+    out = []
+    pos = 0
+    for m in _MATH_RE.finditer(title):
+        out.append(normalize_title(title[pos : m.start()]))
+        out.append(_convert_math(m.group(0)))
+        pos = m.end()
+    out.append(normalize_title(title[pos:]))
+    return "".join(out)
 
 
 def get_title(paper, config):
-    texkey = get_texkey(paper)
-    overrides = config.get("title_overrides", {}) or {}
-    if texkey in overrides:
-        return overrides[texkey]
-    titles = paper.get("titles", [])
-    if not titles:
+    if paper.texkey in config.title_overrides:
+        return config.title_overrides[paper.texkey]
+    if paper.title is None:
         return ""
 
     # Strategy: use journal (first) title for published papers,
     # arXiv title for submitted/unpublished (title-cased, author's original).
-    pub_infos = paper.get("publication_info", [])
-    has_journal = bool(pub_infos and pub_infos[0].get("journal_title"))
+    has_journal = bool(paper.pub_info.get("journal_title"))
 
     if has_journal:
         # Published: use default (journal) title
-        title = titles[0].get("title", "")
+        title = paper.title
     else:
         # Not published: prefer arXiv title (title-cased)
-        title = _get_arxiv_title(paper) or titles[0].get("title", "")
+        title = paper.arxiv_title or paper.title
 
     # Strip outer braces from INSPIRE
     if title.startswith("{") and title.endswith("}"):
         title = title[1:-1]
-    # Convert MathML fragments to LaTeX
-    title = _mathml_to_latex(title)
-    # Fix unicode
-    title = _fix_title_unicode(title)
-    # Replace {\&} or bare & with \&
-    title = title.replace("{\\&}", "\\&")
-    title = re.sub(r"(?<!\\)&", r"\\&", title)
-    return title
+    return title_to_latex(title)
 
 
 # ---------------------------------------------------------------------------
@@ -358,21 +1997,17 @@ def get_pub_info(paper, config):
 
     Returns dict with: status, journal, volume, pages, year, doi, inspire_journal
     """
-    texkey = get_texkey(paper)
-    override = config.get("overrides", {}).get(texkey, {})
-    doi = get_doi(paper)
+    override = config.overrides.get(paper.texkey, {})
+    doi = paper.doi
     if override.get("doi"):
         doi = override["doi"]
 
     # Check INSPIRE publication_info first
-    pub_infos = paper.get("publication_info", [])
-    pi = pub_infos[0] if pub_infos else {}
+    pi = paper.pub_info
     inspire_journal = pi.get("journal_title", "")
 
     if inspire_journal:
-        journal_latex = config.get("journal_map", {}).get(
-            inspire_journal, inspire_journal
-        )
+        journal_latex = config.journal_map.get(inspire_journal, inspire_journal)
         volume = pi.get("journal_volume", "")
         year = str(pi.get("year", ""))
         page_start = pi.get("page_start", "")
@@ -423,9 +2058,17 @@ def get_pub_info(paper, config):
                 "inspire_journal": "",
             }
         elif status == "submitted":
-            return {"status": "submitted", "journal": override.get("journal", ""), "doi": doi}
+            return {
+                "status": "submitted",
+                "journal": override.get("journal", ""),
+                "doi": doi,
+            }
         elif status == "accepted":
-            return {"status": "accepted", "journal": override.get("journal", ""), "doi": doi}
+            return {
+                "status": "accepted",
+                "journal": override.get("journal", ""),
+                "doi": doi,
+            }
         elif status == "book_chapter":
             return {
                 "status": "book_chapter",
@@ -514,49 +2157,50 @@ def format_reference(paper, config):
 # ---------------------------------------------------------------------------
 
 
-def _find_philcox_position(authors):
-    for i, a in enumerate(authors):
-        if is_philcox_author(a.get("full_name", "")):
-            return i
-    return None
-
-
-def _format_authors_truncated(paper, config):
+def _format_authors_truncated(paper, config, highlight_pos):
     """Format author list with uniform truncation rule.
 
     - <=6 authors: list all
     - >6 authors: list first 6 then et al.
-    - If Philcox is not in the first 6, append "(inc. Philcox)".
+    - If the highlighted author is on the paper but not in the first 6,
+      append "(inc. Name)".
+
+    ``highlight_pos`` comes from ``scan_authors``, so the full list is only
+    searched when the highlighted author is not in the formatted prefix.
     """
-    authors = paper.get("authors", [])
+    authors = paper.authors
     n = len(authors)
-    author_overrides = config.get("author_name_overrides", {}) or {}
+    author_overrides = config.author_name_overrides
+    highlight = config.highlight_surname()
 
     if n <= CONTRIB_AUTHOR_TRUNCATE:
         parts = [
-            format_author_name(a.get("full_name", ""), author_overrides) for a in authors
+            format_author_name(name, author_overrides, highlight) for name in authors
         ]
         return ", ".join(parts)
 
     parts = [
-        format_author_name(a.get("full_name", ""), author_overrides)
-        for a in authors[:CONTRIB_AUTHOR_TRUNCATE]
+        format_author_name(name, author_overrides, highlight)
+        for name in authors[:CONTRIB_AUTHOR_TRUNCATE]
     ]
     suffix = r", \textit{et al.}"
 
-    pos = _find_philcox_position(authors)
-    if pos is None or pos >= CONTRIB_AUTHOR_TRUNCATE:
-        suffix += r" (inc.\,\," + PHILCOX_BOLD + ")"
+    if highlight_pos is None:
+        for name in authors[CONTRIB_AUTHOR_TRUNCATE:]:
+            if is_highlighted_author(name, highlight):
+                bold = format_author_name(name, author_overrides, highlight)
+                suffix += r" (inc.\,\," + bold + ")"
+                break
 
     return ", ".join(parts) + suffix
 
 
-def format_author_list_major(paper, config):
-    return _format_authors_truncated(paper, config)
+def format_author_list_major(paper, config, highlight_pos):
+    return _format_authors_truncated(paper, config, highlight_pos)
 
 
-def format_author_list_contributing(paper, config):
-    return _format_authors_truncated(paper, config)
+def format_author_list_contributing(paper, config, highlight_pos):
+    return _format_authors_truncated(paper, config, highlight_pos)
 
 
 # ---------------------------------------------------------------------------
@@ -566,14 +2210,13 @@ def format_author_list_contributing(paper, config):
 
 def format_item(paper, config, is_contributing=False):
     """Format a single \\item line for pubs.tex."""
-    authors = paper.get("authors", [])
-    is_alpha = detect_alphabetized(authors)
+    is_alpha, highlight_pos = scan_authors(paper.authors, config.highlight_surname())
     star = "*" if is_alpha else ""
 
     if is_contributing:
-        author_str = format_author_list_contributing(paper, config)
+        author_str = format_author_list_contributing(paper, config, highlight_pos)
     else:
-        author_str = format_author_list_major(paper, config)
+        author_str = format_author_list_major(paper, config, highlight_pos)
 
     title = get_title(paper, config)
     ref = format_reference(paper, config)
@@ -588,34 +2231,587 @@ def format_item(paper, config, is_contributing=False):
 
 
 # ---------------------------------------------------------------------------
-# Full pubs.tex generation
+# BibTeX entry formatting
 # ---------------------------------------------------------------------------
 
 
-def generate_pubstex(papers, config):
-    """Generate the full pubs.tex content."""
-    major = []
-    contributing = []
+def bibtex_escape(text):
+    """Convert accented characters to braced LaTeX, as INSPIRE's BibTeX does
+    (e.g. 'Flöss' -> 'Fl{\\"o}ss')."""
+    if text.isascii():
+        return text
+    return text.translate(_BIBTEX_TRANS)
+
+
+def _bibtex_author(full_name):
+    # INSPIRE's BibTeX spaces out run-together initials: "Oliver H.E." -> "Oliver H. E."
+    return bibtex_escape(re.sub(r"\.(?=[A-Z])", ". ", full_name))
+
+
+def _bibtex_journal(journal):
+    """INSPIRE 'Phys.Rev.D' or LaTeX 'Phys.\,Rev.\,D' -> 'Phys. Rev. D'."""
+    journal = journal.replace("\\,", " ")
+    return re.sub(r"\.(?=\S)", ". ", journal)
+
+
+def _bibtex_field(name, value):
+    value = str(value)
+    if '"' in value:
+        return f"    {name} = {{{value}}}"
+    return f'    {name} = "{value}"'
+
+
+def _journal_ref(paper, pub):
+    """``(journal, volume, number, pages)`` of a published paper's
+    ``get_pub_info`` result, written out as in INSPIRE's BibTeX."""
+    if not pub["inspire_journal"]:
+        return _bibtex_journal(pub["journal"]), pub["volume"], "", pub["pages"]
+    pi = paper.pub_info
+    page_start, page_end = pi.get("page_start", ""), pi.get("page_end", "")
+    if page_start and page_end and page_start != page_end:
+        pages = f"{page_start}--{page_end}"
+    else:
+        pages = pi.get("artid", "") or page_start
+    return (
+        _bibtex_journal(pub["inspire_journal"]),
+        pub["volume"],
+        pi.get("journal_issue", ""),
+        pages,
+    )
+
+
+def format_bibtex_entry(paper, config):
+    """Format a single papers.bib entry from an INSPIRE record.
+
+    Titles, arXiv ids and publication details go through the same
+    ``get_title``/``get_pub_info``/``get_arxiv_id`` helpers as pubs.tex, so
+    config overrides apply to the website bibliography too.  Field order and
+    layout follow INSPIRE's own BibTeX export.
+    """
+    texkey = paper.texkey
+    entry_type = BIBTEX_ENTRY_TYPES.get(paper.document_type, "article")
+
+    fields = []
+    if texkey in config.selected_papers:
+        fields.append("    selected = {true}")
+        fields.append("    bibtex_show = {true}")
+    if paper.control_number:
+        # Shows the InspireHEP citations badge, read from citations.json
+        fields.append(_bibtex_field("inspirehep_id", paper.control_number))
+
+    authors = paper.authors
+    if len(authors) > BIBTEX_MAX_AUTHORS:
+        author_str = _bibtex_author(authors[0]) + " and others"
+    else:
+        author_str = " and ".join(_bibtex_author(name) for name in authors)
+    if author_str:
+        fields.append(_bibtex_field("author", author_str))
+    if paper.collaboration:
+        fields.append(_bibtex_field("collaboration", paper.collaboration))
+
+    fields.append(_bibtex_field("title", "{" + get_title(paper, config) + "}"))
+
+    arxiv_id = get_arxiv_id(paper, config)
+    if arxiv_id:
+        fields.append(_bibtex_field("eprint", arxiv_id))
+        fields.append(_bibtex_field("archivePrefix", "arXiv"))
+        if paper.arxiv_category:
+            fields.append(_bibtex_field("primaryClass", paper.arxiv_category))
+    if paper.report_number:
+        fields.append(_bibtex_field("reportNumber", paper.report_number))
+
+    pub = get_pub_info(paper, config)
+    if pub.get("doi"):
+        fields.append(_bibtex_field("doi", pub["doi"]))
+    if pub["status"] == "published":
+        journal, volume, number, pages = _journal_ref(paper, pub)
+        fields.append(_bibtex_field("journal", journal))
+        for name, value in (
+            ("volume", volume),
+            ("number", number),
+            ("pages", pages),
+        ):
+            if value:
+                fields.append(_bibtex_field(name, value))
+        year = pub["year"]
+    else:
+        # Unpublished: INSPIRE dates the entry by its first (preprint) version
+        date = paper.date
+        year = date[:4]
+        if len(date) >= 7:
+            fields.append(_bibtex_field("month", str(int(date[5:7]))))
+    if year:
+        fields.append(_bibtex_field("year", year))
+
+    return f"@{entry_type}{{{texkey},\n" + ",\n".join(fields) + "\n}\n"
+
+
+# ---------------------------------------------------------------------------
+# Website data (publications.json)
+# ---------------------------------------------------------------------------
+
+
+# LaTeX symbol commands -> Unicode, inverted from the title tables; where
+# several characters share a command, the Greek-block letter wins
+_HTML_SYMBOLS = {}
+for _char, _latex in [*MATHML_OPERATORS.items(), *GREEK_TO_LATEX.items()]:
+    if re.fullmatch(r"\\[A-Za-z]+", _latex) and (
+        _latex not in _HTML_SYMBOLS or "\u0391" <= _char <= "\u03c9"
+    ):
+        _HTML_SYMBOLS[_latex] = _char
+del _char, _latex
+
+# LaTeX commands taking one argument -> (HTML before, HTML after)
+_HTML_COMMANDS = {
+    "\\textit": ("<em>", "</em>"),
+    "\\emph": ("<em>", "</em>"),
+    "\\textbf": ("<strong>", "</strong>"),
+    "\\mbox": ("", ""),
+    "\\text": ("", ""),
+    "\\mathrm": ("", ""),
+    "\\sqrt": ("\u221a(", ")"),
+    "\\tilde": ("", "\u0303"),
+    "\\hat": ("", "\u0302"),
+    "\\bar": ("", "\u0304"),
+    "\\vec": ("", "\u20d7"),
+    "\\dot": ("", "\u0307"),
+    "\\ddot": ("", "\u0308"),
+}
+
+# Typographic ligatures outside math
+_HTML_TEXT = {
+    "---": "\u2014",
+    "--": "\u2013",
+    "``": "\u201c",
+    "''": "\u201d",
+    "`": "\u2018",
+    "'": "\u2019",
+}
+
+_LATEX_TOKEN_RE = re.compile(
+    r"\\[A-Za-z]+ ?|\\.|---|--|``|''|[{}_^$`']|[^\\{}_^$`'-]+|-"
+)
+
+
+def _html_token(tok, tokens, math):
+    """HTML for the LaTeX token ``tok``, consuming any arguments it takes
+    from ``tokens`` (a reversed token list)."""
+    if tok == "{":
+        return _html_group(tokens, math, "}")
+    if tok == "$" and not math:
+        return _html_group(tokens, True, "$")
+    if tok in ("_", "^") and math:
+        tag = "sub" if tok == "_" else "sup"
+        return f"<{tag}>{_html_arg(tokens, math)}</{tag}>"
+    if tok.startswith("\\"):
+        command = tok.rstrip()
+        if command in _HTML_COMMANDS:
+            before, after = _HTML_COMMANDS[command]
+            return before + _html_arg(tokens, math) + after
+        if command == "\\frac":
+            numerator = _html_arg(tokens, math)
+            return f"{numerator}/{_html_arg(tokens, math)}"
+        if command == "\\,":
+            return "\u2009"
+        if len(command) == 2:  # \&, \%, \# ...
+            return html.escape(command[1])
+        # \rm and other unknown commands are dropped
+        return _HTML_SYMBOLS.get(command, "")
+    if math:
+        return html.escape(tok.replace("'", "\u2032"))
+    return _HTML_TEXT.get(tok) or html.escape(tok)
+
+
+def _html_arg(tokens, math):
+    """HTML for the next argument: a group, a command, or one character."""
+    while tokens and tokens[-1] == " ":
+        tokens.pop()
+    if not tokens:
+        return ""
+    tok = tokens.pop()
+    if len(tok) > 1 and not tok.startswith("\\") and tok not in _HTML_TEXT:
+        tokens.append(tok[1:])
+        tok = tok[0]
+    return _html_token(tok, tokens, math)
+
+
+def _html_group(tokens, math, until):
+    out = []
+    while tokens:
+        tok = tokens.pop()
+        if tok == until:
+            break
+        out.append(_html_token(tok, tokens, math))
+    return "".join(out)
+
+
+def latex_to_html(latex):
+    r"""Render the LaTeX of a title as HTML for site layouts: math becomes
+    Unicode with <sub>/<sup>, \textit becomes <em>, and escapes and
+    ligatures become the characters they stand for.
+
+    >>> latex_to_html(r"$f_{\rm NL}$ \& $\Lambda$CDM in \textit{Planck} -- 1\%")
+    'f<sub>NL</sub> &amp; ΛCDM in <em>Planck</em> – 1%'
+    """
+    tokens = _LATEX_TOKEN_RE.findall(latex)
+    tokens.reverse()
+    return _html_group(tokens, False, None)
+
+
+def _web_author(full_name):
+    """INSPIRE "Last, First" -> ``{"first": ..., "last": ...}``, with
+    run-together initials spaced out as in papers.bib."""
+    last, _, first = full_name.partition(",")
+    return {"first": re.sub(r"\.(?=[A-Z])", ". ", first.strip()), "last": last.strip()}
+
+
+def format_publication(paper, config, category):
+    """One paper as a plain mapping for ``_data/publications.json``, so site
+    layouts can list publications without parsing BibTeX.
+
+    Built with the same helpers (and so the same overrides) as pubs.tex and
+    papers.bib.  Authors are truncated like papers.bib; ``author_count``
+    gives the full number.  Names are plain Unicode, ``title`` is HTML
+    ready to print, and ``title_latex`` is the title as in papers.bib.
+    """
+    pub = get_pub_info(paper, config)
+    arxiv_id = get_arxiv_id(paper, config) or None
+    doi = pub.get("doi") or None
+    authors = paper.authors
+    if len(authors) > BIBTEX_MAX_AUTHORS:
+        authors = authors[:1]
+    title = get_title(paper, config)
+    record = {
+        "recid": paper.control_number,
+        "texkey": paper.texkey,
+        "type": BIBTEX_ENTRY_TYPES.get(paper.document_type, "article"),
+        "category": category,
+        "selected": paper.texkey in config.selected_papers,
+        "authors": [_web_author(name) for name in authors],
+        "author_count": len(paper.authors),
+        "collaboration": paper.collaboration or None,
+        "title": latex_to_html(title),
+        "title_latex": title,
+        "status": pub["status"],
+        "venue": None,
+        "volume": None,
+        "number": None,
+        "pages": None,
+        "year": paper.date[:4] or None,
+        "arxiv": arxiv_id,
+        "arxiv_url": f"https://arxiv.org/abs/{arxiv_id}" if arxiv_id else None,
+        "doi": doi,
+        "doi_url": f"https://doi.org/{doi}" if doi else None,
+    }
+    if pub["status"] == "published":
+        journal, volume, number, pages = _journal_ref(paper, pub)
+        record.update(
+            venue=journal,
+            volume=volume or None,
+            number=number or None,
+            pages=pages.replace("--", "\u2013") or None,
+            year=pub["year"] or None,
+        )
+    elif pub["status"] in ("submitted", "accepted"):
+        record["venue"] = _bibtex_journal(pub["journal"]) or None
+    return record
+
+
+# ---------------------------------------------------------------------------
+# Duplicate detection
+# ---------------------------------------------------------------------------
+
+# Shortest normalised title used as a duplicate key, so that generic titles
+# ("Erratum", "Reply") never collide
+MIN_TITLE_KEY_LENGTH = 20
+
+_TITLE_KEY_STRIP = re.compile(r"<[^>]*>|\\[a-z]+|[^a-z0-9]")
+
+
+def _eprint_key(arxiv_id):
+    """An arXiv id without case, ``arXiv:`` prefix or version.
+
+    >>> _eprint_key("arXiv:2504.03826v2") == _eprint_key("2504.03826")
+    True
+    """
+    return re.sub(r"v\d+$", "", arxiv_id.lower().removeprefix("arxiv:"))
+
+
+def duplicate_keys(paper):
+    """Keys under which two INSPIRE records are the same paper: the arXiv
+    eprint (without version), the DOI, and the normalised title plus first
+    author surname."""
+    keys = []
+    if paper.arxiv_id:
+        keys.append(("arXiv eprint", _eprint_key(paper.arxiv_id)))
+    if paper.doi:
+        keys.append(("DOI", paper.doi.lower()))
+    if paper.title and paper.authors:
+        title = _TITLE_KEY_STRIP.sub("", paper.title.lower())
+        if len(title) >= MIN_TITLE_KEY_LENGTH:
+            surname = _TITLE_KEY_STRIP.sub(
+                "", paper.authors[0].partition(",")[0].lower()
+            )
+            keys.append(("title", f"{title}/{surname}"))
+    return keys
+
+
+def _identifiers_conflict(a, b):
+    """True if ``a`` and ``b`` carry different arXiv eprints or DOIs,
+    compared as in ``duplicate_keys``."""
+    return bool(
+        (
+            a.arxiv_id
+            and b.arxiv_id
+            and _eprint_key(a.arxiv_id) != _eprint_key(b.arxiv_id)
+        )
+        or (a.doi and b.doi and a.doi.lower() != b.doi.lower())
+    )
+
+
+def _record_preference(paper):
+    """Published records beat ones with only a DOI, which beat arXiv-only ones."""
+    return (
+        bool(paper.pub_info.get("journal_title")),
+        bool(paper.doi),
+        bool(paper.arxiv_id),
+    )
+
+
+class DuplicateIndex:
+    """Hash indexes from duplicate keys to output slots, so duplicates are
+    found in one linear pass without comparing records pairwise.
+
+    Each slot holds the preferred record seen so far for one paper;
+    ``merged`` lists ``(dropped texkey, kept texkey, matched key)``.
+    """
+
+    def __init__(self):
+        self.slot_of = {}
+        self.kept = []
+        self.merged = []
+
+    def add(self, paper):
+        """Index ``paper``, returning ``(slot, keep)``: its output slot, and
+        whether it should be rendered there (it is new, or preferred over the
+        record currently kept in that slot)."""
+        keys = duplicate_keys(paper)
+        slot = kind = None
+        for key in keys:
+            match = self.slot_of.get(key)
+            if match is None:
+                continue
+            # A title match only counts if the identifiers don't disagree
+            if key[0] == "title" and _identifiers_conflict(paper, self.kept[match]):
+                continue
+            slot, kind = match, key[0]
+            break
+        if slot is None:
+            slot, keep = len(self.kept), True
+            self.kept.append(paper)
+        else:
+            current = self.kept[slot]
+            keep = _record_preference(paper) > _record_preference(current)
+            if keep:
+                self.kept[slot] = paper
+                self.merged.append((current.texkey, paper.texkey, kind))
+            else:
+                self.merged.append((paper.texkey, current.texkey, kind))
+        for key in keys:
+            self.slot_of.setdefault(key, slot)
+        return slot, keep
+
+
+# ---------------------------------------------------------------------------
+# Incremental rendering
+# ---------------------------------------------------------------------------
+
+
+def _digest(obj):
+    blob = json.dumps(obj, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def render_version(config):
+    """Digest of everything that affects every rendered paper: this script's
+    source and the config settings shared across papers."""
+    with open(os.path.abspath(__file__), "rb") as f:
+        code = hashlib.sha256(f.read()).hexdigest()
+    return _digest([code, dict(config.journal_map), config.highlight_surname()])
+
+
+def paper_digest(paper, config, category):
+    """Digest of one paper's inputs and the slice of config that applies to it."""
+    author_overrides = config.author_name_overrides
+    # Citation counts change daily but are not rendered
+    return _digest(
+        [
+            dataclasses.replace(paper, citation_count=None),
+            category,
+            dict(config.overrides.get(paper.texkey, {})),
+            config.title_overrides.get(paper.texkey),
+            paper.texkey in config.selected_papers,
+            {n: author_overrides[n] for n in paper.authors if n in author_overrides},
+        ]
+    )
+
+
+class RenderManifest:
+    """Sidecar file caching each paper's rendered pubs.tex line, BibTeX
+    entry and publications.json record, keyed by control number and
+    validated by ``paper_digest``.
+
+    The whole manifest is discarded when ``version`` (see ``render_version``)
+    changes, or if ``reset`` is set.  Only papers seen in the current run
+    are written back, so removed papers drop out.
+    """
+
+    def __init__(self, path, version, reset=False):
+        self.path = path
+        self.version = version
+        self.entries = {}
+        self.seen = {}
+        self.reused = 0
+        self.rendered = 0
+        if reset:
+            return
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == version:
+            self.entries = data.get("papers", {})
+
+    def lookup(self, control_number, digest):
+        entry = self.entries.get(str(control_number))
+        if entry and entry.get("hash") == digest:
+            return entry
+        return {}
+
+    def record(self, control_number, digest, item, bibtex, reused, publication=None):
+        self.seen[str(control_number)] = {
+            "hash": digest,
+            "item": item,
+            "bibtex": bibtex,
+            "publication": publication,
+        }
+        if reused:
+            self.reused += 1
+        else:
+            self.rendered += 1
+
+    def next_run(self):
+        """Start another run in the same process (--watch): entries rendered
+        so far become reusable, and only papers seen from now on are saved."""
+        self.entries.update(self.seen)
+        self.seen = {}
+        self.reused = 0
+        self.rendered = 0
+
+    def save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"version": self.version, "papers": self.seen}, f)
+        os.replace(tmp, self.path)
+
+
+# ---------------------------------------------------------------------------
+# Full output generation
+# ---------------------------------------------------------------------------
+
+
+def generate_outputs(
+    papers, config, pubstex=True, bibtex=True, manifest=None, data=False
+):
+    """Generate pubs.tex, papers.bib and (with ``data``) publications.json
+    content in a single pass over papers.
+
+    ``papers`` may be any iterable of Paper records (e.g. built from the
+    generator returned by ``iter_papers_json``); each paper is formatted as
+    soon as it arrives.  Duplicate records are collapsed as they arrive (see
+    DuplicateIndex), identically for every output.  If a RenderManifest is
+    given, papers whose inputs are unchanged since the last run reuse their
+    cached lines.  Returns ``(pubstex, bibtex, publications)``, with None
+    for any output not requested.
+    """
+    # (category, item, bibtex entry, publication) per DuplicateIndex slot
+    rendered = []
+    dupes = DuplicateIndex()
 
     for paper in papers:
-        texkey = get_texkey(paper)
-        cat = classify_paper(texkey, config)
+        t0 = time.perf_counter()
+        cat = classify_paper(paper.texkey, config)
         if cat == "exclude":
+            stats.add("Classify + digest", time.perf_counter() - t0)
             continue
-        elif cat == "contributing":
-            contributing.append(paper)
+        slot, keep = dupes.add(paper)
+        if not keep:
+            stats.add("Classify + digest", time.perf_counter() - t0)
+            continue
+        item = entry = record = None
+        cached = {}
+        if manifest is not None:
+            digest = paper_digest(paper, config, cat)
+            cached = manifest.lookup(paper.control_number, digest)
+        t1 = time.perf_counter()
+        stats.add("Classify + digest", t1 - t0)
+        if pubstex:
+            item = cached.get("item")
+            if item is None:
+                item = format_item(
+                    paper, config, is_contributing=(cat == "contributing")
+                )
+                stats.add("Format item", time.perf_counter() - t1)
+        if bibtex:
+            entry = cached.get("bibtex")
+            if entry is None:
+                t2 = time.perf_counter()
+                entry = format_bibtex_entry(paper, config)
+                stats.add("BibTeX entry", time.perf_counter() - t2)
+        if data:
+            record = cached.get("publication")
+            if record is None:
+                t3 = time.perf_counter()
+                record = format_publication(paper, config, cat)
+                stats.add("Publication data", time.perf_counter() - t3)
+        if slot == len(rendered):
+            rendered.append((cat, item, entry, record))
         else:
-            major.append(paper)
+            rendered[slot] = (cat, item, entry, record)
+        if manifest is not None:
+            manifest.record(
+                paper.control_number,
+                digest,
+                item=item if pubstex else cached.get("item"),
+                bibtex=entry if bibtex else cached.get("bibtex"),
+                publication=record if data else cached.get("publication"),
+                reused=bool(cached),
+            )
+
+    for dropped, kept, kind in dupes.merged:
+        print(f"  Merged duplicate {dropped} into {kept} (same {kind})")
+        stats.count("Duplicates merged")
+
+    major = [item for cat, item, _, _ in rendered if cat != "contributing"]
+    contributing = [item for cat, item, _, _ in rendered if cat == "contributing"]
+    return (
+        _assemble_pubstex(major, contributing, config) if pubstex else None,
+        "\n".join(entry for _, _, entry, _ in rendered) if bibtex else None,
+        [record for _, _, _, record in rendered] if data else None,
+    )
+
 
+def _assemble_pubstex(major, contributing, config):
     lines = []
 
     # --- Major Author ---
     lines.append(r"\textit{\textbf{Major Author}}")
     lines.append(r"\begin{enumerate}")
-    for paper in major:
-        lines.append(format_item(paper, config, is_contributing=False))
+    lines.extend(major)
     # Append any extra major-author items not in INSPIRE
-    for extra in config.get("extra_major_author", []):
+    for extra in config.extra_major_author:
         lines.append(extra.rstrip())
     lines.append(r"\end{enumerate}")
     lines.append("")
@@ -626,8 +2822,7 @@ def generate_pubstex(papers, config):
     lines.append(r"\textit{\textbf{Contributing Author}}")
     lines.append("")
     lines.append(r"\begin{enumerate}[resume]")
-    for paper in contributing:
-        lines.append(format_item(paper, config, is_contributing=True))
+    lines.extend(contributing)
     lines.append(r"\end{enumerate}")
     lines.append("")
     lines.append(r"\vskip 4 pt ")
@@ -636,54 +2831,136 @@ def generate_pubstex(papers, config):
     # --- Other Works ---
     lines.append(r"\textit{\textbf{Other Works}}")
     lines.append(r"\begin{enumerate}[resume]")
-    other_works = config.get("other_works", "")
+    other_works = config.other_works
     lines.append(other_works.rstrip())
     lines.append(r"\end{enumerate}")
 
     return "\n".join(lines)
 
 
+def generate_pubstex(papers, config):
+    """Generate the full pubs.tex content."""
+    return generate_outputs(papers, config, bibtex=False)[0]
+
+
+def generate_bibtex(papers, config):
+    """Generate the full papers.bib content, skipping excluded papers and
+    flagging selected ones with selected/bibtex_show."""
+    return generate_outputs(papers, config, pubstex=False)[1]
+
+
 # ---------------------------------------------------------------------------
-# BibTeX generation
+# Group batch mode
 # ---------------------------------------------------------------------------
 
 
-def generate_bibtex(raw_bib, config):
-    """Process raw BibTeX: inject selected flags, remove excluded entries."""
-    excluded = set(config.get("exclude", []))
-    selected = set(config.get("selected_papers", []))
+@dataclasses.dataclass(frozen=True, slots=True)
+class GroupMember:
+    config: Config
+    config_dir: str  # member output paths are relative to this
 
-    # Split into individual entries (split on blank-line-then-@)
-    entries = re.split(r"\n(?=@)", raw_bib.lstrip())
-    result = []
 
-    for entry in entries:
-        if not entry.strip():
-            continue
+def load_group(path):
+    """Read a group file, returning ``(members, settings)``.
 
-        # Extract texkey
-        m = re.match(r"@\w+\{([^,]+),", entry)
-        if not m:
-            result.append(entry)
+    The file lists ``members``, each a mapping with a ``config`` path
+    (relative to the group file) and an optional ``author_query`` that
+    overrides the one in that config.  A member writes only the outputs its
+    config names, never the defaults, which point at this site's own files.
+    Optional settings: ``output_bibtex`` (the merged group bibliography,
+    relative to the group file) and ``workers`` (concurrent requests).
+    """
+    with open(path, "rb") as f:
+        data = _yaml_load(f.read(), path) or {}
+    group_dir = os.path.dirname(os.path.abspath(path))
+    errors = []
+    for key in data:
+        if key not in ("members", "output_bibtex", "workers"):
+            errors.append(f"unknown key '{key}'")
+    workers = data.get("workers")
+    if workers is not None and (
+        not isinstance(workers, int) or isinstance(workers, bool) or workers < 1
+    ):
+        errors.append("'workers' must be a positive integer")
+    members = []
+    entries = data.get("members")
+    if not isinstance(entries, list) or not entries:
+        errors.append("'members' must be a non-empty list")
+        entries = []
+    for i, entry in enumerate(entries):
+        if not isinstance(entry, dict) or not isinstance(entry.get("config"), str):
+            errors.append(f"members[{i}] must be a mapping with a 'config' path")
             continue
-        texkey = m.group(1).strip()
-
-        if texkey in excluded:
+        config_path = os.path.normpath(os.path.join(group_dir, entry["config"]))
+        try:
+            data = _load_config_data(config_path) or {}
+            config = Config.from_dict(data)
+        except (ConfigError, OSError) as e:
+            errors.append(f"members[{i}] ({entry['config']}): {e}")
             continue
+        unset = {key: None for key in GROUP_MEMBER_OUTPUTS if data.get(key) is None}
+        config = dataclasses.replace(config, **unset)
+        if entry.get("author_query"):
+            config = dataclasses.replace(config, author_query=entry["author_query"])
+        members.append(GroupMember(config, os.path.dirname(config_path)))
+    if errors:
+        raise ConfigError(f"{path}:\n  " + "\n  ".join(errors))
+    settings = {
+        "output_bibtex": (
+            os.path.normpath(os.path.join(group_dir, data["output_bibtex"]))
+            if data.get("output_bibtex")
+            else None
+        ),
+        "workers": data.get("workers") or DEFAULT_GROUP_WORKERS,
+    }
+    return members, settings
+
+
+def fetch_group(
+    queries, page_size=DEFAULT_PAGE_SIZE, cache=None, workers=DEFAULT_GROUP_WORKERS
+):
+    """Fetch several authors' publication lists into one in-memory store.
+
+    Each author's listing is fetched as control numbers only; the union is
+    then downloaded once, in batched ``recid:`` queries, so co-authored
+    papers are fetched once however many members share them.  Both steps
+    run on a pool of ``workers`` threads.  Returns ``(listings, papers)``:
+    ``{query: [control_number, ...]}`` in listing order, and
+    ``{control_number: Paper}``.
+    """
+    queries = list(dict.fromkeys(queries))
 
-        # Inject selected/bibtex_show for selected papers (if not already present)
-        if texkey in selected and "selected" not in entry:
-            first_nl = entry.index("\n")
-            entry = (
-                entry[: first_nl + 1]
-                + "    selected = {true},\n"
-                + "    bibtex_show = {true},\n"
-                + entry[first_nl + 1 :]
+    def _listing(query):
+        return [
+            hit["metadata"]["control_number"]
+            for hit in iter_search_hits(
+                author_search(query), page_size, cache=cache, fields=["control_number"]
             )
+        ]
 
-        result.append(entry)
+    def _records(recids):
+        return [
+            Paper.from_metadata(hit["metadata"])
+            for hit in iter_search_hits(
+                recid_search(recids), page_size, cache=cache, fields=Paper.FIELDS
+            )
+        ]
 
-    return "\n".join(result)
+    import concurrent.futures
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        listings = dict(zip(queries, pool.map(_listing, queries)))
+        unique = sorted(set().union(*listings.values()))
+        batches = [
+            unique[i : i + RECID_BATCH_SIZE]
+            for i in range(0, len(unique), RECID_BATCH_SIZE)
+        ]
+        papers = {
+            paper.control_number: paper
+            for batch in pool.map(_records, batches)
+            for paper in batch
+        }
+    return listings, papers
 
 
 # ---------------------------------------------------------------------------
@@ -691,11 +2968,627 @@ def generate_bibtex(raw_bib, config):
 # ---------------------------------------------------------------------------
 
 
+@contextlib.contextmanager
+def _timed_block(timings, label):
+    """Record the wall time of a ``with`` block in ``timings[label]``."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[label] = time.perf_counter() - t0
+
+
+def _timed(timings, label, fn, *args):
+    """Call ``fn(*args)``, recording its wall time in ``timings[label]``."""
+    t0 = time.perf_counter()
+    try:
+        return fn(*args)
+    finally:
+        timings[label] = time.perf_counter() - t0
+
+
+def _profiled(profile_path, fn, *args):
+    """Call ``fn(*args)``, dumping a cProfile/pstats file to ``profile_path``
+    if one is given."""
+    if not profile_path:
+        return fn(*args)
+    import cProfile
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(fn, *args)
+    finally:
+        profiler.dump_stats(profile_path)
+        print(f"  Profile written to {profile_path}")
+
+
+def _print_summary(timings, cache):
+    print("Timings:")
+    for label, seconds in timings.items():
+        print(f"  {label:<24s} {seconds:7.2f}s")
+    print("Stages:")
+    for stage, seconds in stats.seconds.items():
+        print(f"  {stage:<24s} {seconds:7.2f}s  {stats.calls[stage]:>7d} calls")
+    for name, n in stats.counters.items():
+        print(f"  {name:<24s} {n:>8d}")
+    if cache is not None:
+        print(f"Cache: {cache.hits} hits, {cache.misses} downloads")
+    names = _format_author_name.cache_info()
+    print(f"Author names: {names.misses} formatted, {names.hits} cached")
+    math = _convert_math.cache_info()
+    if math.misses:
+        print(f"MathML fragments: {math.misses} converted, {math.hits} cached")
+
+
+def _write_timings_json(path, timings, cache):
+    names = _format_author_name.cache_info()
+    math = _convert_math.cache_info()
+    report = {
+        "timings": {label: round(seconds, 6) for label, seconds in timings.items()},
+        **stats.as_dict(),
+        "author_names": {"formatted": names.misses, "cached": names.hits},
+        "mathml_fragments": {"converted": math.misses, "cached": math.hits},
+    }
+    if cache is not None:
+        report["cache"] = {"hits": cache.hits, "downloads": cache.misses}
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+    print(f"Timings written to {path}")
+
+
+def write_if_changed(path, content):
+    """Atomically write ``content`` to ``path`` unless it already holds it.
+
+    The new content is written to a temporary file in the same directory and
+    renamed into place, so readers never see a half-written file, and an
+    unchanged file keeps its mtime.  Returns True if the file was updated.
+    """
+    data = content.encode("utf-8")
+    try:
+        with open(path, "rb") as f:
+            if hashlib.sha256(f.read()).digest() == hashlib.sha256(data).digest():
+                return False
+    except FileNotFoundError:
+        pass
+    out_dir = os.path.dirname(path) or "."
+    os.makedirs(out_dir, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(
+        dir=out_dir, prefix=".tmp-", suffix=os.path.basename(path)
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        if os.path.exists(path):
+            shutil.copymode(path, tmp)
+        else:
+            os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return True
+
+
+def _write_output(config_dir, path, content, label, dry_run, preview_chars=None):
+    """Write one output file, returning True if its content changed."""
+    out = os.path.normpath(os.path.join(config_dir, path))
+    if dry_run:
+        if preview_chars:
+            print(f"\n=== {label} (first {preview_chars} chars) ===")
+            print(content[:preview_chars])
+        else:
+            print(f"\n=== {label} ===")
+            print(content)
+        return False
+    with stats.timer("Write"):
+        changed = write_if_changed(out, content)
+    stats.count(
+        "Bytes written" if changed else "Bytes unchanged", len(content.encode("utf-8"))
+    )
+    print(f"  {'Updated' if changed else 'Unchanged'}: {out}")
+    return changed
+
+
+def _track_papers(papers, seen, citations):
+    """Pass ``papers`` through, adding each texkey to the set ``seen`` and
+    each citation count (None if missing) to the dict ``citations``."""
+    for paper in papers:
+        seen.add(paper.texkey)
+        citations[paper.control_number] = paper.citation_count
+        yield paper
+
+
+def _write_citations(config_dir, path, citations, dry_run):
+    """Write ``{recid: count}`` with a fetch timestamp for the Jekyll
+    citations plugin, returning True if the counts changed.  Papers whose
+    count is unknown (None, e.g. in an --offline run) keep the count already
+    in the file.  An existing file (and so its timestamp) is left alone when
+    no count has changed; a missing or unreadable one is always written."""
+    out = os.path.normpath(os.path.join(config_dir, path))
+    try:
+        with open(out) as f:
+            previous = json.load(f)["citations"]
+        if not isinstance(previous, dict):
+            previous = None
+    except (FileNotFoundError, ValueError, KeyError, TypeError):
+        previous = None
+    counts = {}
+    for cn, n in sorted(citations.items()):
+        if n is None and previous is not None:
+            n = previous.get(str(cn))
+        if n is not None:
+            counts[str(cn)] = n
+    if counts == previous:
+        print(f"  Unchanged: {out}")
+        return False
+    data = {
+        "fetched_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "citations": counts,
+    }
+    content = json.dumps(data, indent=2) + "\n"
+    return _write_output(
+        config_dir, path, content, "citations.json", dry_run, preview_chars=500
+    )
+
+
+def _wants_publications(args, config):
+    """Whether to build publications.json, which (like papers.bib) feeds
+    the website."""
+    return bool(config.output_publications) and not args.pubstex_only
+
+
+def _write_publications(config_dir, path, publications, dry_run):
+    """Write the publications.json records, returning True if it changed."""
+    content = json.dumps(publications, indent=2, ensure_ascii=False) + "\n"
+    return _write_output(
+        config_dir, path, content, "publications.json", dry_run, preview_chars=2000
+    )
+
+
+def _fetch_direct(
+    args,
+    config,
+    query,
+    page_size,
+    max_records,
+    cache,
+    timings,
+    manifest,
+    seen,
+    citations,
+):
+    """Fetch the JSON listing without the record store, formatting each page
+    of papers as it arrives.  Returns ``(pubstex, bibtex, publications)``."""
+    print("Fetching papers from INSPIRE JSON API...")
+
+    def _papers():
+        for hit in iter_papers_json(query, page_size, max_records, cache):
+            yield Paper.from_metadata(hit["metadata"])
+
+    outputs = _timed(
+        timings,
+        "Fetch + format",
+        _profiled,
+        args.profile,
+        generate_outputs,
+        _track_papers(_papers(), seen, citations),
+        config,
+        not args.bibtex_only,
+        not args.pubstex_only,
+        manifest,
+        _wants_publications(args, config),
+    )
+    print(f"  Fetched {len(seen)} papers")
+    return outputs
+
+
+def _open_run(args, config, config_dir):
+    """Set up the response cache, HTTP session and render manifest for a
+    single-config run, returning ``(cache, manifest)``."""
+    cache = None
+    if not args.no_cache:
+        cache_dir = os.path.normpath(
+            os.path.join(
+                config_dir,
+                args.cache_dir or config.cache_dir,
+            )
+        )
+        cache = ResponseCache(
+            cache_dir,
+            ttl=config.cache_ttl,
+            offline=args.offline,
+        )
+
+    configure_http(
+        pool_size=config.http_pool_size,
+        timeout=config.http_timeout,
+        api_url=args.api_url or config.api_url,
+        retry_attempts=config.retry_attempts,
+        retry_budget=config.retry_budget,
+    )
+
+    # A capped listing is a partial view, so it neither uses nor updates the
+    # render manifest
+    manifest = None
+    if not (args.max_records or config.max_records):
+        manifest_path = os.path.normpath(
+            os.path.join(config_dir, config.render_manifest)
+        )
+        manifest = RenderManifest(
+            manifest_path, render_version(config), reset=args.force_render
+        )
+    return cache, manifest
+
+
+def _store_path(args, config, config_dir):
+    """Path of the record store, or None if this run bypasses it."""
+    # A capped listing is a one-off view, so it bypasses the record store
+    if args.no_store or args.max_records or config.max_records:
+        return None
+    return os.path.normpath(os.path.join(config_dir, config.record_store))
+
+
+def _generate(args, config, config_dir, cache, store, manifest):
+    """Fetch ``config``'s papers (syncing ``store`` first if there is one)
+    and write its outputs, returning True if any output file changed."""
+    query = config.author_query
+    page_size = args.page_size or config.page_size
+    max_records = args.max_records or config.max_records
+    timings = {}
+    t_start = time.perf_counter()
+
+    seen = set()
+    citations = {}
+    if store is None:
+        pubstex, bibtex, publications = _fetch_direct(
+            args,
+            config,
+            query,
+            page_size,
+            max_records,
+            cache,
+            timings,
+            manifest,
+            seen,
+            citations,
+        )
+    else:
+        if args.offline and len(store):
+            print(f"Offline: using {len(store)} records from {store.path}")
+        else:
+            print("Syncing INSPIRE records...")
+            n_changed = _timed(
+                timings,
+                "Sync",
+                sync_store,
+                store,
+                query,
+                page_size,
+                cache,
+                args.full_sync,
+            )
+            print(
+                f"  Downloaded {n_changed} new/updated records "
+                f"({len(store)} in store)"
+            )
+        pubstex, bibtex, publications = _timed(
+            timings,
+            "Format",
+            _profiled,
+            args.profile,
+            generate_outputs,
+            _track_papers(store.papers(), seen, citations),
+            config,
+            not args.bibtex_only,
+            not args.pubstex_only,
+            manifest,
+            _wants_publications(args, config),
+        )
+
+    # Texkeys outside a capped listing are expected to be missing
+    if not max_records:
+        config.check_texkeys(seen)
+
+    any_changed = False
+    if pubstex is not None:
+        # Write to all configured output paths
+        for key in ["output_pubstex", "output_pubstex_ci"]:
+            path = getattr(config, key)
+            if path:
+                any_changed |= _write_output(
+                    config_dir, path, pubstex, "pubs.tex", args.dry_run
+                )
+
+    if bibtex is not None:
+        any_changed |= _write_output(
+            config_dir,
+            config.output_bibtex,
+            bibtex,
+            "papers.bib",
+            args.dry_run,
+            preview_chars=3000,
+        )
+
+    if publications is not None:
+        any_changed |= _write_publications(
+            config_dir, config.output_publications, publications, args.dry_run
+        )
+
+    # Citation counts feed the website, and a capped listing would drop some
+    if config.output_citations and not args.pubstex_only and not max_records:
+        missing = [cn for cn, n in citations.items() if n is None]
+        if missing and not args.offline:
+            citations.update(
+                _timed(
+                    timings,
+                    "Citations",
+                    fetch_citation_counts,
+                    missing,
+                    page_size,
+                    cache,
+                )
+            )
+        any_changed |= _write_citations(
+            config_dir, config.output_citations, citations, args.dry_run
+        )
+
+    if manifest is not None:
+        if not args.dry_run:
+            manifest.save()
+        print(
+            f"Rendered {manifest.rendered} papers, reused {manifest.reused} unchanged"
+        )
+
+    timings["Total"] = time.perf_counter() - t_start
+    _print_summary(timings, cache)
+    if args.timings_json:
+        _write_timings_json(args.timings_json, timings, cache)
+    print("Done." if any_changed or args.dry_run else "Done (no outputs changed).")
+    return any_changed
+
+
+def _log(message):
+    print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] {message}", flush=True)
+
+
+def _describe_change(old, new):
+    """Say what differs between two ``poll_inspire`` signatures."""
+    (old_total, old_newest), (total, newest) = old, new
+    changes = []
+    if total != old_total:
+        changes.append(f"{old_total} -> {total} records")
+    if newest != old_newest:
+        changes.append(f"record updated at {newest}")
+    return "INSPIRE changed (" + ", ".join(changes) + ")"
+
+
+def _open_watch_run(args, config, config_dir):
+    """``_open_run`` for --watch.  Regenerating means INSPIRE has changed,
+    so cached responses are always revalidated rather than reused within
+    their TTL."""
+    cache, manifest = _open_run(args, config, config_dir)
+    if cache is not None:
+        cache.ttl = 0
+    return cache, manifest
+
+
+def _watch(args, config):
+    """--watch: render once, then poll INSPIRE and the config file's mtime,
+    regenerating whenever either changes, until interrupted.
+
+    The config, the record store (with its parsed Papers) and the render
+    manifest stay in memory between cycles.  Failed checks and
+    regenerations back off exponentially up to ``watch_max_interval``, with a
+    traceback logged for anything but a network or data error; a config file
+    that no longer loads is reported and the previous config kept.
+    """
+    config_path = os.path.abspath(args.config)
+    config_dir = os.path.dirname(config_path)
+    config_mtime = os.stat(config_path).st_mtime_ns
+    cache, manifest = _open_watch_run(args, config, config_dir)
+    store_path = _store_path(args, config, config_dir)
+    store = RecordStore(store_path) if store_path else None
+    # Records updated before today are already in the first render
+    since = time.strftime("%Y-%m-%d", time.gmtime())
+    signature = None
+    pending = ["first run"]
+    failures = 0
+    delay = 0
+    try:
+        while True:
+            time.sleep(delay)
+            try:
+                mtime = os.stat(config_path).st_mtime_ns
+            except OSError:
+                mtime = config_mtime
+            if mtime != config_mtime:
+                config_mtime = mtime
+                try:
+                    new_config = load_config(config_path)
+                except (ConfigError, OSError) as e:
+                    _log(f"Config not reloaded, keeping the previous one: {e}")
+                    new_config = config
+                if new_config != config:
+                    if new_config.author_query != config.author_query:
+                        signature = None
+                    config = new_config
+                    cache, manifest = _open_watch_run(args, config, config_dir)
+                    if _store_path(args, config, config_dir) != store_path:
+                        if store is not None:
+                            store.close()
+                        store_path = _store_path(args, config, config_dir)
+                        store = RecordStore(store_path) if store_path else None
+                    pending.append("config changed")
+
+            interval = args.watch_interval or config.watch_interval
+            stats.reset()
+            _retry_policy.spent = 0.0
+            if cache is not None:
+                cache.hits = cache.misses = 0
+            try:
+                new_signature = poll_inspire(
+                    config.author_query, since, args.page_size or config.page_size
+                )
+                if signature is not None and new_signature != signature:
+                    pending.append(_describe_change(signature, new_signature))
+                signature = new_signature
+                if signature[1]:
+                    since = signature[1][:10]
+                if pending:
+                    _log("Regenerating: " + "; ".join(pending))
+                    if manifest is not None:
+                        manifest.next_run()
+                    _generate(args, config, config_dir, cache, store, manifest)
+                    pending = []
+                failures = 0
+                delay = interval
+            except Exception as e:
+                # Keep watching whatever broke; the next cycle retries
+                failures += 1
+                delay = min(interval * 2 ** (failures - 1), config.watch_max_interval)
+                expected = (_requests().RequestException, OSError, ValueError, KeyError)
+                if isinstance(e, expected):
+                    _log(f"Check failed: {e}; retrying in {delay}s")
+                else:
+                    trace = traceback.format_exc().rstrip()
+                    _log(f"Check failed; retrying in {delay}s\n{trace}")
+    except KeyboardInterrupt:
+        _log("Stopped.")
+    finally:
+        if store is not None:
+            store.close()
+    return 0
+
+
+def _run_group(args, parser):
+    """--group: fetch every member's papers once, then render each member's
+    outputs and the merged group bibliography."""
+    try:
+        members, settings = load_group(args.group)
+    except (ConfigError, OSError) as e:
+        parser.error(str(e))
+    lead = members[0].config
+    group_dir = os.path.dirname(os.path.abspath(args.group))
+    page_size = args.page_size or lead.page_size
+
+    cache = None
+    if not args.no_cache:
+        cache = ResponseCache(
+            os.path.normpath(os.path.join(group_dir, args.cache_dir or lead.cache_dir)),
+            ttl=lead.cache_ttl,
+            offline=args.offline,
+        )
+    workers = settings["workers"]
+    configure_http(
+        pool_size=max(lead.http_pool_size, workers),
+        timeout=lead.http_timeout,
+        api_url=args.api_url or lead.api_url,
+        retry_attempts=lead.retry_attempts,
+        retry_budget=lead.retry_budget,
+    )
+    timings = {}
+    t_start = time.perf_counter()
+
+    print(f"Fetching papers for {len(members)} group members...")
+    listings, papers = _timed(
+        timings,
+        "Fetch",
+        fetch_group,
+        [m.config.author_query for m in members],
+        page_size,
+        cache,
+        workers,
+    )
+    print(f"  Fetched {len(papers)} unique papers")
+
+    any_changed = False
+    group_papers = {}
+    with _timed_block(timings, "Format + write"):
+        for member in members:
+            config = member.config
+            member_papers = [
+                papers[cn] for cn in listings[config.author_query] if cn in papers
+            ]
+            print(f"{config.author_query}: {len(member_papers)} papers")
+            pubstex, bibtex, publications = _profiled(
+                args.profile,
+                generate_outputs,
+                member_papers,
+                config,
+                not args.bibtex_only,
+                not args.pubstex_only,
+                None,
+                _wants_publications(args, config),
+            )
+            if pubstex is not None:
+                for key in ["output_pubstex", "output_pubstex_ci"]:
+                    path = getattr(config, key)
+                    if path:
+                        any_changed |= _write_output(
+                            member.config_dir, path, pubstex, "pubs.tex", args.dry_run
+                        )
+            if bibtex is not None and config.output_bibtex:
+                any_changed |= _write_output(
+                    member.config_dir,
+                    config.output_bibtex,
+                    bibtex,
+                    "papers.bib",
+                    args.dry_run,
+                    preview_chars=3000,
+                )
+            if publications is not None:
+                any_changed |= _write_publications(
+                    member.config_dir,
+                    config.output_publications,
+                    publications,
+                    args.dry_run,
+                )
+            for paper in member_papers:
+                if paper.texkey not in config.exclude:
+                    group_papers[paper.control_number] = paper
+
+        # The merged bibliography keeps any paper a member lists, most
+        # recent first
+        if settings["output_bibtex"] and not args.pubstex_only:
+            merged = sorted(group_papers.values(), key=lambda p: p.date, reverse=True)
+            group_config = dataclasses.replace(
+                lead,
+                contributing_author=frozenset(),
+                exclude=frozenset(),
+                selected_papers=frozenset(),
+            )
+            bibtex = generate_bibtex(merged, group_config)
+            print(f"Group bibliography: {len(merged)} papers")
+            any_changed |= _write_output(
+                group_dir,
+                settings["output_bibtex"],
+                bibtex,
+                "group papers.bib",
+                args.dry_run,
+                preview_chars=3000,
+            )
+
+    timings["Total"] = time.perf_counter() - t_start
+    _print_summary(timings, cache)
+    if args.timings_json:
+        _write_timings_json(args.timings_json, timings, cache)
+    print("Done." if any_changed or args.dry_run else "Done (no outputs changed).")
+    if args.exit_code and any_changed:
+        return EXIT_CHANGED
+    return 0
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate CV publications from INSPIRE-HEP"
     )
-    parser.add_argument("--config", required=True, help="Path to YAML config file")
+    parser.add_argument("--config", help="Path to YAML config file")
+    parser.add_argument(
+        "--group",
+        metavar="PATH",
+        help="Group file listing several member configs, fetched together",
+    )
     parser.add_argument(
         "--dry-run", action="store_true", help="Print output instead of writing files"
     )
@@ -705,59 +3598,111 @@ def main():
     parser.add_argument(
         "--pubstex-only", action="store_true", help="Only generate pubs.tex"
     )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        help=f"Records per INSPIRE page (default: {DEFAULT_PAGE_SIZE})",
+    )
+    parser.add_argument(
+        "--max-records",
+        type=int,
+        help="Upper bound on the number of records fetched (default: no limit)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help=f"Directory for cached INSPIRE responses (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Always fetch fresh from INSPIRE"
+    )
+    parser.add_argument(
+        "--api-url",
+        help=f"INSPIRE literature search endpoint (default: {INSPIRE_API_URL})",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Build outputs purely from cached responses, without network access",
+    )
+    parser.add_argument(
+        "--no-store",
+        action="store_true",
+        help="Fetch full listings directly instead of syncing the local record store",
+    )
+    parser.add_argument(
+        "--full-sync",
+        action="store_true",
+        help="Re-download every record into the local record store",
+    )
+    parser.add_argument(
+        "--force-render",
+        action="store_true",
+        help="Re-render every paper instead of reusing unchanged cached lines",
+    )
+    parser.add_argument(
+        "--exit-code",
+        action="store_true",
+        help=(
+            f"Exit with status {EXIT_CHANGED} if any output file changed, "
+            "0 if none did"
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="Write a cProfile/pstats dump of the formatting stage to PATH "
+        "(with --no-store this includes fetching, which streams into it)",
+    )
+    parser.add_argument(
+        "--timings-json",
+        metavar="PATH",
+        help="Write per-stage timings and counters as JSON to PATH",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running, regenerating whenever INSPIRE or the config file changes",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=int,
+        metavar="SECONDS",
+        help=f"Seconds between --watch checks (default: {DEFAULT_WATCH_INTERVAL})",
+    )
     args = parser.parse_args()
+    if bool(args.config) == bool(args.group):
+        parser.error("exactly one of --config or --group is required")
+    if args.group:
+        if args.watch:
+            parser.error("--watch requires --config")
+        if args.offline and args.no_cache:
+            parser.error("--offline requires the response cache")
+        return _run_group(args, parser)
+
+    if args.watch and args.offline:
+        parser.error("--watch polls INSPIRE, so it cannot be combined with --offline")
+    if args.offline and args.no_cache:
+        parser.error("--offline requires the response cache")
+    try:
+        config = load_config(args.config)
+    except (ConfigError, OSError) as e:
+        parser.error(str(e))
+    if args.watch:
+        return _watch(args, config)
 
-    config = load_config(args.config)
-    query = config.get("author_query", "Oliver.H.E.Philcox.1")
     config_dir = os.path.dirname(os.path.abspath(args.config))
-
-    if not args.bibtex_only:
-        print("Fetching papers from INSPIRE JSON API...")
-        papers_raw = fetch_papers_json(query)
-        papers = [p["metadata"] for p in papers_raw]
-        print(f"  Fetched {len(papers)} papers")
-
-        pubstex = generate_pubstex(papers, config)
-
-        # Write to all configured output paths
-        out_keys = ["output_pubstex", "output_pubstex_ci"]
-        if args.dry_run:
-            print("\n=== pubs.tex ===")
-            print(pubstex)
-        else:
-            for key in out_keys:
-                path = config.get(key)
-                if not path:
-                    continue
-                out = os.path.normpath(os.path.join(config_dir, path))
-                os.makedirs(os.path.dirname(out), exist_ok=True)
-                with open(out, "w") as f:
-                    f.write(pubstex)
-                print(f"  Wrote {out}")
-
-    if not args.pubstex_only:
-        print("Fetching BibTeX from INSPIRE...")
-        raw_bib = fetch_bibtex(query)
-        print(f"  Fetched BibTeX ({len(raw_bib)} bytes)")
-
-        bibtex = generate_bibtex(raw_bib, config)
-
-        out = os.path.normpath(
-            os.path.join(
-                config_dir, config.get("output_bibtex", "../_bibliography/papers.bib")
-            )
-        )
-        if args.dry_run:
-            print("\n=== papers.bib (first 3000 chars) ===")
-            print(bibtex[:3000])
-        else:
-            os.makedirs(os.path.dirname(out), exist_ok=True)
-            with open(out, "w") as f:
-                f.write(bibtex)
-            print(f"  Wrote {out}")
-
-    print("Done.")
+    cache, manifest = _open_run(args, config, config_dir)
+    store_path = _store_path(args, config, config_dir)
+    store = RecordStore(store_path) if store_path else None
+    try:
+        any_changed = _generate(args, config, config_dir, cache, store, manifest)
+    finally:
+        if store is not None:
+            store.close()
+    if args.exit_code and any_changed:
+        return EXIT_CHANGED
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
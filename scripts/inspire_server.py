@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the INSPIRE-HEP literature API.
+
+Serves INSPIRE search responses from local files so generate_pubs.py can run
+deterministically without network access, optionally with injected latency
+and errors to exercise its retry and caching behaviour.  Three sources:
+
+  --record DIR    proxy requests to the real INSPIRE, saving each response
+                  into DIR as it is served
+  --replay DIR    serve responses previously saved with --record
+  --listing FILE  page through a literature.json listing (e.g. written by
+                  bench_pubs.py --fixture-dir), answering "a NAME", "du >="
+                  and "recid:" queries and format=bibtex from the matching .bib
+
+Usage:
+    python scripts/inspire_server.py --record fixtures/inspire
+    python scripts/inspire_server.py --replay fixtures/inspire --latency 0.2
+    python scripts/inspire_server.py --listing /tmp/fx/literature.json --error-rate 0.2
+    python scripts/generate_pubs.py --config scripts/pubs_config.yaml \\
+        --api-url http://127.0.0.1:8765/literature
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+DEFAULT_PORT = 8765
+DEFAULT_UPSTREAM = "https://inspirehep.net/api"
+DEFAULT_PAGE_SIZE = 10  # INSPIRE's own default
+
+# ---------------------------------------------------------------------------
+# Response sources
+# ---------------------------------------------------------------------------
+
+
+def request_key(path, query):
+    """Canonical key for a request: path plus sorted query parameters."""
+    return path + "?" + urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+
+
+class Recording:
+    """Responses saved under ``directory``: an ``index.json`` mapping request
+    keys to status, content type and body file, plus the upstream base URL
+    that links inside the bodies point to."""
+
+    def __init__(self, directory, upstream=DEFAULT_UPSTREAM):
+        self.directory = directory
+        self.lock = threading.Lock()
+        path = os.path.join(directory, "index.json")
+        if os.path.exists(path):
+            with open(path) as f:
+                data = json.load(f)
+            self.upstream = data["upstream"]
+            self.responses = data["responses"]
+        else:
+            self.upstream = upstream
+            self.responses = {}
+
+    def get(self, key):
+        entry = self.responses.get(key)
+        if entry is None:
+            return None
+        with open(os.path.join(self.directory, entry["file"]), "rb") as f:
+            return entry["status"], entry["content_type"], f.read()
+
+    def add(self, key, status, content_type, body):
+        name = hashlib.sha256(key.encode()).hexdigest()[:16] + ".body"
+        with self.lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, name), "wb") as f:
+                f.write(body)
+            self.responses[key] = {
+                "status": status,
+                "content_type": content_type,
+                "file": name,
+            }
+            tmp = os.path.join(self.directory, "index.json.tmp")
+            with open(tmp, "w") as f:
+                json.dump(
+                    {"upstream": self.upstream, "responses": self.responses},
+                    f,
+                    indent=1,
+                    sort_keys=True,
+                )
+            os.replace(tmp, os.path.join(self.directory, "index.json"))
+
+
+def fetch_upstream(upstream, path, query, accept):
+    """GET ``upstream + path?query``, returning (status, content type, body)."""
+    url = upstream.rstrip("/") + path + ("?" + query if query else "")
+    request = urllib.request.Request(
+        url, headers={"Accept": accept or "application/json"}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=60) as resp:
+            return resp.status, resp.headers.get("Content-Type", ""), resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers.get("Content-Type", ""), e.read()
+
+
+class Listing:
+    """A synthetic INSPIRE search over the hits in a literature.json file."""
+
+    def __init__(self, path):
+        with open(path) as f:
+            self.hits = json.load(f)["hits"]["hits"]
+        self.bibtex = {}
+        bib_path = os.path.splitext(path)[0] + ".bib"
+        if os.path.exists(bib_path):
+            with open(bib_path) as f:
+                for entry in re.split(r"\n(?=@)", f.read()):
+                    m = re.match(r"@\w+\{([^,]+),", entry.strip())
+                    if m:
+                        self.bibtex[m.group(1)] = entry.strip() + "\n"
+
+    def search(self, base_url, path, params, max_page_size=None):
+        hits = self.hits
+        q = params.get("q", "")
+        # "a NAME" keeps hits with a matching author name; a name matching
+        # nobody (e.g. an INSPIRE BAI) selects the whole listing
+        m = re.match(r"a\s+(\S+)", q)
+        if m:
+            name = m.group(1).lower()
+            matched = [
+                h
+                for h in hits
+                if any(
+                    name in a["full_name"].lower()
+                    for a in h["metadata"].get("authors", [])
+                )
+            ]
+            hits = matched or hits
+        m = re.search(r"du\s*>=\s*(\S+)", q)
+        if m:
+            hits = [h for h in hits if h.get("updated", "")[:10] >= m.group(1)]
+        recids = re.findall(r"recid:(\d+)", q)
+        if recids:
+            wanted = {int(r) for r in recids}
+            hits = [h for h in hits if h["metadata"]["control_number"] in wanted]
+
+        size = int(params.get("size", DEFAULT_PAGE_SIZE))
+        if max_page_size:
+            size = min(size, max_page_size)
+        page = int(params.get("page", 1))
+        chunk = hits[(page - 1) * size : page * size]
+
+        if params.get("format") == "bibtex":
+            body = "\n".join(
+                self.bibtex.get(h["metadata"]["texkeys"][0], "") for h in chunk
+            )
+            return 200, "application/x-bibtex", body.encode()
+        links = {}
+        if page * size < len(hits):
+            links["next"] = (
+                base_url
+                + path
+                + "?"
+                + urlencode(dict(params, size=size, page=page + 1))
+            )
+        body = {"hits": {"hits": chunk, "total": len(hits)}, "links": links}
+        return 200, "application/json", json.dumps(body).encode()
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+
+class Faults:
+    """Latency and error injection, applied before each response."""
+
+    def __init__(
+        self,
+        latency=0.0,
+        jitter=0.0,
+        error_rate=0.0,
+        error_status=503,
+        fail_first=0,
+        retry_after=None,
+        seed=0,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.fail_first = fail_first
+        self.retry_after = retry_after
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+
+    def next_error(self):
+        """Sleep for the configured latency, then return the error status to
+        send for this request, or None to serve it normally."""
+        with self.lock:
+            self.requests += 1
+            n = self.requests
+            delay = self.latency + self.rng.uniform(0, self.jitter)
+            fail = n <= self.fail_first or self.rng.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+        return self.error_status if fail else None
+
+
+class InspireHandler(BaseHTTPRequestHandler):
+    server_version = "inspire-stand-in/1"
+
+    def log_message(self, fmt, *args):
+        if not self.server.quiet:
+            sys.stderr.write(f"{self.address_string()} {fmt % args}\n")
+
+    def _send(self, status, content_type, body, headers=()):
+        etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if status == 200:
+            self.send_header("ETag", etag)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        error = server.faults.next_error()
+        if error is not None:
+            headers = []
+            if server.faults.retry_after is not None:
+                headers.append(("Retry-After", str(server.faults.retry_after)))
+            body = json.dumps({"status": error, "message": "injected error"}).encode()
+            self._send(error, "application/json", body, headers)
+            return
+
+        split = urlsplit(self.path)
+        base_url = f"http://{self.headers.get('Host', '127.0.0.1')}"
+        if server.listing is not None:
+            params = dict(parse_qsl(split.query, keep_blank_values=True))
+            self._send(
+                *server.listing.search(
+                    base_url, split.path, params, server.max_page_size
+                )
+            )
+            return
+
+        key = request_key(split.path, split.query)
+        response = server.recording.get(key)
+        if response is None:
+            if not server.record:
+                body = json.dumps(
+                    {"status": 404, "message": f"not recorded: {key}"}
+                ).encode()
+                self._send(404, "application/json", body)
+                return
+            response = fetch_upstream(
+                server.recording.upstream,
+                split.path,
+                split.query,
+                self.headers.get("Accept"),
+            )
+            if response[0] == 200:
+                server.recording.add(key, *response)
+        status, content_type, body = response
+        # Links in recorded bodies point upstream; send clients back here
+        body = body.replace(
+            server.recording.upstream.rstrip("/").encode(), base_url.encode()
+        )
+        self._send(status, content_type, body)
+
+
+def make_server(
+    host="127.0.0.1",
+    port=DEFAULT_PORT,
+    recording=None,
+    listing=None,
+    record=False,
+    faults=None,
+    max_page_size=None,
+    quiet=False,
+):
+    """Build (but do not start) the stand-in server."""
+    server = ThreadingHTTPServer((host, port), InspireHandler)
+    server.recording = recording
+    server.listing = listing
+    server.record = record
+    server.faults = faults or Faults()
+    server.max_page_size = max_page_size
+    server.quiet = quiet
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Local stand-in for the INSPIRE-HEP literature API"
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
+        "--record", metavar="DIR", help="Proxy to INSPIRE, saving responses into DIR"
+    )
+    source.add_argument(
+        "--replay", metavar="DIR", help="Serve responses saved with --record"
+    )
+    source.add_argument(
+        "--listing", metavar="FILE", help="Page through a literature.json listing"
+    )
+    parser.add_argument(
+        "--upstream",
+        default=DEFAULT_UPSTREAM,
+        help=f"API base URL proxied by --record (default: {DEFAULT_UPSTREAM})",
+    )
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="Address to bind (default: 127.0.0.1)"
+    )
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds added to every response"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="Up to this many extra random seconds"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Fraction of requests that fail"
+    )
+    parser.add_argument(
+        "--error-status",
+        type=int,
+        default=503,
+        help="HTTP status for injected failures, e.g. 429 or 502 (default: 503)",
+    )
+    parser.add_argument(
+        "--fail-first", type=int, default=0, help="Fail the first N requests"
+    )
+    parser.add_argument(
+        "--retry-after",
+        type=int,
+        help="Retry-After seconds sent with injected failures",
+    )
+    parser.add_argument(
+        "--max-page-size",
+        type=int,
+        help="With --listing, cap the page size to force more pages",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Random seed for jitter and errors"
+    )
+    parser.add_argument("--quiet", action="store_true", help="Do not log requests")
+    args = parser.parse_args()
+
+    recording = listing = None
+    if args.listing:
+        listing = Listing(args.listing)
+    else:
+        directory = args.record or args.replay
+        if args.replay and not os.path.exists(os.path.join(directory, "index.json")):
+            parser.error(f"no recording in {directory}")
+        recording = Recording(directory, upstream=args.upstream)
+    faults = Faults(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        fail_first=args.fail_first,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    server = make_server(
+        args.host,
+        args.port,
+        recording=recording,
+        listing=listing,
+        record=bool(args.record),
+        faults=faults,
+        max_page_size=args.max_page_size,
+        quiet=args.quiet,
+    )
+    print(f"Serving on http://{args.host}:{args.port}/literature", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())